@@ -1,9 +1,15 @@
 """NAIF PDS4 Bundle Namespace."""
-import pkg_resources
+from importlib import resources
 
-__version__ = VERSION = (
-    pkg_resources.resource_string(__name__, "VERSION.txt").decode("utf-8").strip()
-)
+#
+# ``importlib.resources.files`` is only available from Python 3.9 onwards.
+#
+if hasattr(resources, "files"):
+    __version__ = VERSION = (
+        resources.files(__name__).joinpath("VERSION.txt").read_text("utf-8").strip()
+    )
+else:
+    __version__ = VERSION = resources.read_text(__name__, "VERSION.txt").strip()
 
 # For future consideration:
 #
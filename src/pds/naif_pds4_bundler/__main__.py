@@ -50,10 +50,14 @@ optional arguments:
                         not generated.
 
 """
+import functools
+import os
+import sys
 from argparse import ArgumentParser
 from argparse import RawDescriptionHelpFormatter
 from os.path import isdir
 from textwrap import dedent
+from types import SimpleNamespace
 
 from . import __version__
 from .classes.bundle import Bundle
@@ -62,7 +66,6 @@ from .classes.collection import MiscellaneousCollection
 from .classes.collection import SpiceKernelsCollection
 from .classes.list import KernelList
 from .classes.log import Log
-from .classes.object import Object
 from .classes.product import ChecksumProduct
 from .classes.product import InventoryProduct
 from .classes.product import MetaKernelProduct
@@ -72,6 +75,353 @@ from .classes.product import SpiceKernelProduct
 from .classes.setup import Setup
 
 
+@functools.lru_cache(maxsize=None)
+def _build_parser():
+    """Build the NPB command line argument parser.
+
+    The parser does not depend on the arguments of any given run, therefore
+    it is built only once.
+
+    :return: Command line argument parser
+    :rtype: ArgumentParser
+    """
+    header = dedent(
+        f"""\
+
+naif-pds4-bundler-{__version__}, NAIF PDS4 SPICE archive generation pipeline
+
+  naif-pds4-bundler is a command-line utility program that generates PDS4
+  bundles for SPICE kernel archives.
+    """
+    )
+
+    #
+    # Build the argument parser.
+    #
+    parser = ArgumentParser(
+        formatter_class=RawDescriptionHelpFormatter, description=header
+    )
+    parser.add_argument(
+        "config",
+        metavar="CONFIG",
+        type=str,
+        nargs="+",
+        help="XML Configuration file",
+    )
+    parser.add_argument(
+        "-p",
+        "--plan",
+        action="store",
+        type=str,
+        help="Release plan file listing the kernels and/or "
+        "ORBNUM files to be archived. If this argument is not "
+        "provided, all the kernels found in the "
+        "kernels directory specified in the "
+        "configuration file in addition to new "
+        "meta-kernels will be included in the "
+        "increment. If the ``-x --xml`` argument is used "
+        "this argument can be the name of a kernel or the path "
+        "to a release plan file (ORBNUM files will be ignored.)",
+    )
+    parser.add_argument(
+        "-f",
+        "--faucet",
+        default="",
+        action="store",
+        type=str,
+        help="Optional indication for end point of the "
+        "pipeline. Allowed values are: ``clear``, "
+        "``plan``, ``list``, ``checks``, ``staging``, ``bundle``, and ``labels``.",
+    )
+    parser.add_argument(
+        "-l", "--log",
+        help="Write log in file. The file is written in the"
+             "``working_directory`` specified in the configuration file.",
+        action="store_true"
+    )
+    parser.add_argument(
+        "-s",
+        "--silent",
+        help="Log will not be prompted on the terminal during execution.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        help="Full log will be prompted on the terminal "
+        "during execution. If the argument is provided "
+        "the ``-s, --silent`` argument is omitted.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-d",
+        "--diff",
+        default="",
+        action="store",
+        type=str,
+        help="Optional generation of diff reports for "
+        "products. Allowed values are: ``files``, ``log``, and ``all``. "
+        "Files are written in the ``working_directory`` specified in the "
+        "configuration file.",
+    )
+    parser.add_argument(
+        "-c",
+        "--clear",
+        default="",
+        action="store",
+        type=str,
+        help="Clears the files listed in the input file "
+        "from the staging and bundle directories and the "
+        "kernel list from the working directory. The input "
+        "file should be as generated by a prior "
+        "execution with a ``*.file_list`` extension. "
+        "If this argument is provided "
+        "it overwrites the faucet argument to ``clear`` "
+        "and therefore the pipeline is not executed. "
+        "If you provide the adequate ``-f, --faucet`` argument, the "
+        "pipeline will be executed until indicated.",
+    )
+    parser.add_argument(
+        "-k",
+        "--kerlist",
+        action="store",
+        type=str,
+        help="Release plan file listing the kernels to "
+        "be archived along with some parameters "
+        "required for the run. If this argument is "
+        "provided the release plan is not generated.",
+    )
+    parser.add_argument(
+        "-m",
+        "--checksum",
+        help="Obtain MD5 Sums for products defined in the Checksum Registry "
+             "file generated by a previous run. These files are stored in "
+             "in the ``working_directory`` specified in the configuration and "
+             "have a ``*.checksum`` extension. If no Checksum Registry files "
+             "are available product labels from the staging directory will "
+             "be used. This argument is useful if large files have already "
+             "been processed by a previous run.", action="store_true",
+    )
+
+    return parser
+
+
+def _faucet_reached(setup, log, stage):
+    """Stop the log if the pipeline has reached its faucet.
+
+    :param setup: NPB execution Setup object
+    :type setup: object
+    :param log: NPB execution Log object
+    :type log: object
+    :param stage: Pipeline stage that has just been completed
+    :type stage: str
+    :return: True if the pipeline has to stop after the stage
+    :rtype: bool
+    """
+    if setup.faucet == stage:
+        log.stop()
+        return True
+    return False
+
+
+def _generate_pds4_products(
+    setup, bundle, list, spice_kernels_collection, miscellaneous_collection
+):
+    """Generate the PDS4 Document and Miscellaneous collections products.
+
+    Generates the SPICEDS document, the Checksum products --including the
+    ones from previous releases if the bundle has none-- and the collection
+    inventories, and adds the collections to the Bundle.
+
+    :param setup: NPB execution Setup object
+    :type setup: object
+    :param bundle: Bundle object
+    :type bundle: object
+    :param list: Kernel List object
+    :type list: object
+    :param spice_kernels_collection: SPICE Kernels collection
+    :type spice_kernels_collection: object
+    :param miscellaneous_collection: Miscellaneous collection
+    :type miscellaneous_collection: object
+    """
+    #
+    # * Generate the Document Collection.
+    #
+    document_collection = DocumentCollection(setup, bundle)
+    document_collection.set_collection_vid()
+
+    #
+    # * Generate of SPICEDS document.
+    #
+    spiceds = SpicedsProduct(setup, document_collection)
+
+    #
+    # * If the SPICEDS document is generated, generate the
+    #   Documents Collection Inventory.
+    #
+    if spiceds.generated:
+        document_collection.add(spiceds)
+
+        document_collection.set_collection_vid()
+        document_collection_inventory = InventoryProduct(setup, document_collection)
+        document_collection.add(document_collection_inventory)
+
+    #
+    # * Add the SPICE Kernels Collection to the Bundle.
+    #   Note that the Collections are provided to the Bundle Object
+    #   in a given order.
+    #
+    bundle.add(spice_kernels_collection)
+
+    #
+    # * Generate the Miscellaneous collection. The Checksum product
+    #   is initialised in such a way that its name can be obtained.
+    #
+    # * The first thing that is checked is whether if the current
+    #   Bundle has checksums, if not, all the checksums are generated,
+    #   including the corresponding Miscellaneous Collection Inventories
+    #   and labels.
+    #
+    miscellaneous_collection.report()
+
+    if setup.increment:
+        checksum_dir = os.path.join(
+            setup.bundle_directory,
+            f"{setup.mission_acronym}_spice",
+            "miscellaneous",
+            "checksum",
+        )
+        if not isdir(checksum_dir):
+            for release in bundle.history.items():
+                release_checksum = ChecksumProduct(setup, miscellaneous_collection,
+                                                   add_previous_checksum=False)
+                release_checksum.generate(history=release)
+
+                #
+                # Initialise a miscellaneous collection for this previous
+                # release.
+                #
+                release_miscellaneous_collection = MiscellaneousCollection(
+                    setup, bundle, list
+                )
+
+                #
+                # Add the checksum at the release miscellaneous collection
+                # to generate the adequate inventory file and add it to
+                # the current miscellaneous collection for it to be
+                # present at the checksum.
+                #
+                release_miscellaneous_collection.add(release_checksum)
+
+                miscellaneous_collection.add(release_checksum)
+
+                release_miscellaneous_collection.set_collection_vid()
+                release_miscellaneous_collection_inventory = InventoryProduct(
+                    setup, release_miscellaneous_collection
+                )
+
+                release_miscellaneous_collection.add(
+                    release_miscellaneous_collection_inventory
+                )
+                miscellaneous_collection.add(
+                    release_miscellaneous_collection_inventory
+                )
+
+                #
+                # Add release miscellaneous collection.
+                #
+                bundle.add(release_miscellaneous_collection)
+
+        #
+        # * Set the Miscellaneous collection VID.
+        #
+        miscellaneous_collection.set_collection_vid()
+
+    #
+    # * Add the Miscellaneous and Document Collections to the Bundle object.
+    #
+    bundle.add(miscellaneous_collection)
+    bundle.add(document_collection)
+
+    #
+    # * Generate Miscellaneous Collection and initialize the Checksum
+    #   product for the current release.
+    #    * The miscellaneous collection is the one to be guaranteed to be
+    #      updated.
+    #
+    checksum = ChecksumProduct(setup, miscellaneous_collection)
+
+    #
+    # Before adding the checksum to the current collection
+    # we need to specify that is not a new product.
+    #
+    for product in miscellaneous_collection.product:
+        if isinstance(product, ChecksumProduct):
+            product.new_product = False
+
+    miscellaneous_collection.add(checksum)
+    miscellaneous_collection.set_collection_vid()
+
+    checksum.set_coverage()
+    miscellaneous_collection_inventory = InventoryProduct(
+        setup, miscellaneous_collection
+    )
+    miscellaneous_collection.add(miscellaneous_collection_inventory)
+
+    #
+    # * Generate the Bundle label and if necessary the readme file.
+    #
+    bundle.write_readme()
+
+    #
+    # * Generate the Checksum product a posteriori in such a way
+    #   that the miscellaneous collection inventory includes the
+    #   checksum and the checksum includes the md5 hash of the
+    #   Miscellaneous Collection Inventory.
+    #
+    checksum.generate()
+    miscellaneous_collection.add(checksum)
+
+
+def _generate_pds3_products(
+    setup, bundle, list, spice_kernels_collection, miscellaneous_collection
+):
+    """Generate the PDS3 Document and Extras collections products.
+
+    :param setup: NPB execution Setup object
+    :type setup: object
+    :param bundle: Bundle object
+    :type bundle: object
+    :param list: Kernel List object
+    :type list: object
+    :param spice_kernels_collection: SPICE Kernels collection
+    :type spice_kernels_collection: object
+    :param miscellaneous_collection: Miscellaneous (Extras) collection
+    :type miscellaneous_collection: object
+    """
+    document_collection = DocumentCollection(setup, bundle)
+    document_collection.get_pds3_documents()
+
+    bundle.add(spice_kernels_collection)
+    bundle.add(document_collection)
+    bundle.add(miscellaneous_collection)
+
+    checksum = ChecksumProduct(setup, miscellaneous_collection,
+                               add_previous_checksum=False)
+    checksum.generate()
+    miscellaneous_collection.add(checksum)
+
+
+#
+# Generation of the Document and Miscellaneous collections products for each
+# PDS version.
+#
+_PRODUCT_GENERATORS = {
+    "4": _generate_pds4_products,
+    "3": _generate_pds3_products,
+}
+
+
 def main(
     config=False,
     plan=False,
@@ -144,128 +494,18 @@ def main(
     #
     if not config and not plan:
 
-        header = dedent(
-            f"""\
-
-    naif-pds4-bundler-{version}, NAIF PDS4 SPICE archive generation pipeline
-
-      naif-pds4-bundler is a command-line utility program that generates PDS4
-      bundles for SPICE kernel archives.
-        """
-        )
-
         #
-        # Build the argument parser.
+        # Without command line arguments there is no configuration file to
+        # run with: exit without parsing, reporting the error through the
+        # parser to keep its usage line and exit status.
         #
-        parser = ArgumentParser(
-            formatter_class=RawDescriptionHelpFormatter, description=header
-        )
-        parser.add_argument(
-            "config",
-            metavar="CONFIG",
-            type=str,
-            nargs="+",
-            help="XML Configuration file",
-        )
-        parser.add_argument(
-            "-p",
-            "--plan",
-            action="store",
-            type=str,
-            help="Release plan file listing the kernels and/or "
-            "ORBNUM files to be archived. If this argument is not "
-            "provided, all the kernels found in the "
-            "kernels directory specified in the "
-            "configuration file in addition to new "
-            "meta-kernels will be included in the "
-            "increment. If the ``-x --xml`` argument is used "
-            "this argument can be the name of a kernel or the path "
-            "to a release plan file (ORBNUM files will be ignored.)",
-        )
-        parser.add_argument(
-            "-f",
-            "--faucet",
-            default="",
-            action="store",
-            type=str,
-            help="Optional indication for end point of the "
-            "pipeline. Allowed values are: ``clear``, "
-            "``plan``, ``list``, ``checks``, ``staging``, ``bundle``, and ``labels``.",
-        )
-        parser.add_argument(
-            "-l", "--log",
-            help="Write log in file. The file is written in the"
-                 "``working_directory`` specified in the configuration file.",
-            action="store_true"
-        )
-        parser.add_argument(
-            "-s",
-            "--silent",
-            help="Log will not be prompted on the terminal during execution.",
-            action="store_true",
-        )
-        parser.add_argument(
-            "-v",
-            "--verbose",
-            help="Full log will be prompted on the terminal "
-            "during execution. If the argument is provided "
-            "the ``-s, --silent`` argument is omitted.",
-            action="store_true",
-        )
-        parser.add_argument(
-            "-d",
-            "--diff",
-            default="",
-            action="store",
-            type=str,
-            help="Optional generation of diff reports for "
-            "products. Allowed values are: ``files``, ``log``, and ``all``. "
-            "Files are written in the ``working_directory`` specified in the "
-            "configuration file.",
-        )
-        parser.add_argument(
-            "-c",
-            "--clear",
-            default="",
-            action="store",
-            type=str,
-            help="Clears the files listed in the input file "
-            "from the staging and bundle directories and the "
-            "kernel list from the working directory. The input "
-            "file should be as generated by a prior "
-            "execution with a ``*.file_list`` extension. "
-            "If this argument is provided "
-            "it overwrites the faucet argument to ``clear`` "
-            "and therefore the pipeline is not executed. "
-            "If you provide the adequate ``-f, --faucet`` argument, the "
-            "pipeline will be executed until indicated.",
-        )
-        parser.add_argument(
-            "-k",
-            "--kerlist",
-            action="store",
-            type=str,
-            help="Release plan file listing the kernels to "
-            "be archived along with some parameters "
-            "required for the run. If this argument is "
-            "provided the release plan is not generated.",
-        )
-        parser.add_argument(
-            "-m",
-            "--checksum",
-            help="Obtain MD5 Sums for products defined in the Checksum Registry "
-                 "file generated by a previous run. These files are stored in "
-                 "in the ``working_directory`` specified in the configuration and "
-                 "have a ``*.checksum`` extension. If no Checksum Registry files "
-                 "are available product labels from the staging directory will "
-                 "be used. This argument is useful if large files have already "
-                 "been processed by a previous run.", action="store_true",
-        )
+        if len(sys.argv) <= 1:
+            _build_parser().error("the following arguments are required: CONFIG")
 
         #
         # Store the arguments in the args object.
         #
-        args = parser.parse_args()
+        args = _build_parser().parse_args()
         args.config = args.config[0]
 
         #
@@ -279,18 +519,19 @@ def main(
     # main function argument list.
     #
     else:
-        args = Object()
-        args.config = config
-        args.plan = plan
-        args.faucet = faucet
-        args.log = log
-        args.silent = silent
-        args.verbose = verbose
-        args.diff = diff
-        args.debug = debug
-        args.clear = clear
-        args.kerlist = kerlist
-        args.checksum = checksum
+        args = SimpleNamespace(
+            config=config,
+            plan=plan,
+            faucet=faucet,
+            log=log,
+            silent=silent,
+            verbose=verbose,
+            diff=diff,
+            debug=debug,
+            clear=clear,
+            kerlist=kerlist,
+            checksum=checksum,
+        )
 
     #
     # Turn lowercase or uppercase arguments that need it.
@@ -376,8 +617,7 @@ def main(
     #    * The pipeline can be stopped after cleaning up the previous run
     #      by setting ``-f, --faucet`` to ``clear``.
     #
-    if setup.faucet == "clear":
-        log.stop()
+    if _faucet_reached(setup, log, "clear"):
         return
 
     #
@@ -403,8 +643,7 @@ def main(
     #    * The pipeline can be stopped after generating or reading the release
     #      plan by setting ``-f, --faucet`` to ``plan``.
     #
-    if setup.faucet == "plan":
-        log.stop()
+    if _faucet_reached(setup, log, "plan"):
         return
 
     if not args.kerlist:
@@ -416,8 +655,7 @@ def main(
     #    * The pipeline can be stopped after generating or reading the kernel
     #      list plan by setting ``-f, --faucet`` to ``list``.
     #
-    if setup.faucet == "list":
-        log.stop()
+    if _faucet_reached(setup, log, "list"):
         return
 
     #
@@ -429,8 +667,7 @@ def main(
     #    * The pipeline can be stopped after checking the kernel
     #      list by setting ``-f, --faucet`` to ``checks``.
     #
-    if setup.faucet == "checks":
-        log.stop()
+    if _faucet_reached(setup, log, "checks"):
         return
 
     #
@@ -460,10 +697,12 @@ def main(
     #   accordingly.
     #
     for kernel in list.kernel_list:
+        kernel_lower = kernel.lower()
+
         #
         # * Each label is validated after generation.
         #
-        if (".nrb" in kernel.lower()) or (".orb" in kernel.lower()):
+        if kernel_lower.endswith((".nrb", ".orb")):
             #
             # The OrbnumFileProduct has to be provided the kernels collection
             # because it might require to update the kernel list if the
@@ -474,7 +713,7 @@ def main(
                     setup, kernel, miscellaneous_collection, spice_kernels_collection
                 )
             )
-        elif ".tm" not in kernel.lower():
+        elif not kernel_lower.endswith(".tm"):
             spice_kernels_collection.add(
                 SpiceKernelProduct(setup, kernel, spice_kernels_collection)
             )
@@ -543,156 +782,11 @@ def main(
         )
         spice_kernels_collection.add(spice_kernels_collection_inventory)
 
-    if setup.pds_version == "4":
-        #
-        # * Generate the Document Collection.
-        #
-        document_collection = DocumentCollection(setup, bundle)
-        document_collection.set_collection_vid()
-
-        #
-        # * Generate of SPICEDS document.
-        #
-        spiceds = SpicedsProduct(setup, document_collection)
-
-        #
-        # * If the SPICEDS document is generated, generate the
-        #   Documents Collection Inventory.
-        #
-        if spiceds.generated:
-            document_collection.add(spiceds)
-
-            document_collection.set_collection_vid()
-            document_collection_inventory = InventoryProduct(setup, document_collection)
-            document_collection.add(document_collection_inventory)
-
-        #
-        # * Add the SPICE Kernels Collection to the Bundle.
-        #   Note that the Collections are provided to the Bundle Object
-        #   in a given order.
-        #
-        bundle.add(spice_kernels_collection)
-
-        #
-        # * Generate the Miscellaneous collection. The Checksum product
-        #   is initialised in such a way that its name can be obtained.
-        #
-        # * The first thing that is checked is whether if the current
-        #   Bundle has checksums, if not, all the checksums are generated,
-        #   including the corresponding Miscellaneous Collection Inventories
-        #   and labels.
-        #
-        miscellaneous_collection.report()
-
-        if setup.increment:
-            checksum_dir = (
-                setup.bundle_directory
-                + f"/{setup.mission_acronym}_spice/miscellaneous/checksum"
-            )
-            if not isdir(checksum_dir):
-                for release in bundle.history.items():
-                    release_checksum = ChecksumProduct(setup, miscellaneous_collection,
-                                                       add_previous_checksum=False)
-                    release_checksum.generate(history=release)
-
-                    #
-                    # Initialise a miscellaneous collection for this previous
-                    # release.
-                    #
-                    release_miscellaneous_collection = MiscellaneousCollection(
-                        setup, bundle, list
-                    )
-
-                    #
-                    # Add the checksum at the release miscellaneous collection
-                    # to generate the adequate inventory file and add it to
-                    # the current miscellaneous collection for it to be
-                    # present at the checksum.
-                    #
-                    release_miscellaneous_collection.add(release_checksum)
-
-                    miscellaneous_collection.add(release_checksum)
-
-                    release_miscellaneous_collection.set_collection_vid()
-                    release_miscellaneous_collection_inventory = InventoryProduct(
-                        setup, release_miscellaneous_collection
-                    )
-
-                    release_miscellaneous_collection.add(
-                        release_miscellaneous_collection_inventory
-                    )
-                    miscellaneous_collection.add(
-                        release_miscellaneous_collection_inventory
-                    )
-
-                    #
-                    # Add release miscellaneous collection.
-                    #
-                    bundle.add(release_miscellaneous_collection)
-
-            #
-            # * Set the Miscellaneous collection VID.
-            #
-            miscellaneous_collection.set_collection_vid()
-
-        #
-        # * Add the Miscellaneous and Document Collections to the Bundle object.
-        #
-        bundle.add(miscellaneous_collection)
-        bundle.add(document_collection)
-
-        #
-        # * Generate Miscellaneous Collection and initialize the Checksum
-        #   product for the current release.
-        #    * The miscellaneous collection is the one to be guaranteed to be
-        #      updated.
-        #
-        checksum = ChecksumProduct(setup, miscellaneous_collection)
-
-        #
-        # Before adding the checksum to the current collection
-        # we need to specify that is not a new product.
-        #
-        for product in miscellaneous_collection.product:
-            if type(product) == ChecksumProduct:
-                product.new_product = False
-
-        miscellaneous_collection.add(checksum)
-        miscellaneous_collection.set_collection_vid()
-
-        checksum.set_coverage()
-        miscellaneous_collection_inventory = InventoryProduct(
-            setup, miscellaneous_collection
+    generate_products = _PRODUCT_GENERATORS.get(setup.pds_version)
+    if generate_products:
+        generate_products(
+            setup, bundle, list, spice_kernels_collection, miscellaneous_collection
         )
-        miscellaneous_collection.add(miscellaneous_collection_inventory)
-
-        #
-        # * Generate the Bundle label and if necessary the readme file.
-        #
-        bundle.write_readme()
-
-        #
-        # * Generate the Checksum product a posteriori in such a way
-        #   that the miscellaneous collection inventory includes the
-        #   checksum and the checksum includes the md5 hash of the
-        #   Miscellaneous Collection Inventory.
-        #
-        checksum.generate()
-        miscellaneous_collection.add(checksum)
-
-    elif setup.pds_version == "3":
-
-        document_collection = DocumentCollection(setup, bundle)
-        document_collection.get_pds3_documents()
-
-        bundle.add(spice_kernels_collection)
-        bundle.add(document_collection)
-        bundle.add(miscellaneous_collection)
-
-        checksum = ChecksumProduct(setup, miscellaneous_collection,
-                                   add_previous_checksum=False)
-        checksum.generate()
-        miscellaneous_collection.add(checksum)
 
     #
     # * List the files present in the staging area.
@@ -704,8 +798,7 @@ def main(
     #   moving them to the ``bundle_directory`` by setting ``-f, --faucet``
     #   to ``staging``.
     #
-    if setup.faucet == "staging":
-        log.stop()
+    if _faucet_reached(setup, log, "staging"):
         return
 
     #
@@ -726,8 +819,7 @@ def main(
     #   ``bundle_directory`` by setting ``-f, --faucet``. Ch
     #   to ``bundle``.
     #
-    if setup.faucet == "bundle":
-        log.stop()
+    if _faucet_reached(setup, log, "bundle"):
         return
 
     #
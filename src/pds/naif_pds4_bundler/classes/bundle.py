@@ -442,7 +442,7 @@ class Bundle(object):
                                     # configuration. All meta-kernels must have the same
                                     # number of digits in the version field.
                                     #
-                                    if hasattr(self.setup, "mk"):
+                                    if self.setup.mk is not None:
                                         for pattern in self.setup.mk[0]["name"]:
                                             if not isinstance(pattern, list):
                                                 pattern = [pattern]
@@ -485,7 +485,7 @@ class Bundle(object):
 
                                                         break
 
-                                    elif hasattr(self.setup, "mk_inputs"):
+                                    elif self.setup.mk_inputs is not None:
                                         #
                                         # Try to derive the digits from the MK input.
                                         #
@@ -650,34 +650,19 @@ class Bundle(object):
     @spice_exception_handler
     def check_times(self):
         """Check the correctness of the bundle times."""
-        str_msn_strt = self.setup.mission_start
-        str_inc_strt = self.setup.increment_start
-        str_inc_stop = self.setup.increment_finish
-        str_msn_stop = self.setup.mission_finish
+        times = (
+            self.setup.mission_start,
+            self.setup.increment_start,
+            self.setup.increment_finish,
+            self.setup.mission_finish,
+        )
 
         #
         # Remove 'Z' due to a bug in CSPICE N0066. See Header of TPARTV.
         #
-        if 'Z' in str_msn_strt:
-            str_msn_strt = str_msn_strt[:-1]
-        if 'Z' in str_inc_strt:
-            str_inc_strt = str_inc_strt[:-1]
-        if 'Z' in str_inc_stop:
-            str_inc_stop = str_inc_stop[:-1]
-        if 'Z' in str_msn_stop:
-            str_msn_stop = str_msn_stop[:-1]
-
-        et_msn_strt = spiceypy.str2et(str_msn_strt)
-        et_inc_strt = spiceypy.str2et(str_inc_strt)
-        et_inc_stop = spiceypy.str2et(str_inc_stop)
-        et_msn_stop = spiceypy.str2et(str_msn_stop)
-
-        if (
-                not (et_msn_strt <= et_inc_strt)
-                or not (et_inc_strt <= et_inc_stop)
-                or not (et_inc_stop <= et_msn_stop)
-                or not (et_msn_strt < et_msn_stop)
-        ):
+        ets = [spiceypy.str2et(t[:-1] if "Z" in t else t) for t in times]
+
+        if not all(a <= b for a, b in zip(ets, ets[1:])) or not (ets[0] < ets[-1]):
             error_message(
                 "The resulting Mission and Increment start and finish dates "
                 "are incoherent."
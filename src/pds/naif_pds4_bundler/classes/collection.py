@@ -175,7 +175,7 @@ class SpiceKernelsCollection(Collection):
         # account (there is no hybrid possibility but NPB provides a warning
         # message if more meta-kernels are expected).
         #
-        if hasattr(self.setup, "mk_inputs") and (self.setup.args.faucet != "labels"):
+        if (self.setup.mk_inputs is not None) and (self.setup.args.faucet != "labels"):
             if self.setup.mk_inputs["file"]:
                 mks = self.setup.mk_inputs["file"]
                 if not isinstance(mks, list):
@@ -237,7 +237,7 @@ class SpiceKernelsCollection(Collection):
             #
             # If the kernel already exists, it will not be generated.
             #
-            if (hasattr(self.setup, "mk")) and (self.product) and (self.setup.args.faucet != "labels"):
+            if (self.setup.mk is not None) and (self.product) and (self.setup.args.faucet != "labels"):
                 if (
                     self.setup.mk.__len__() == 1
                     and self.setup.mk[0]["name"].__len__() == 1
@@ -325,7 +325,7 @@ class SpiceKernelsCollection(Collection):
                             "times."
                             )
 
-            if hasattr(self.setup, "increment_start"):
+            if self.setup.increment_start is not None:
                 logging.info(
                     f"   Increment stop time set to: "
                     f"{self.setup.increment_start} "
@@ -333,7 +333,7 @@ class SpiceKernelsCollection(Collection):
                 )
                 increment_start = self.setup.increment_start
 
-            if hasattr(self.setup, "increment_finish"):
+            if self.setup.increment_finish is not None:
                 logging.info(
                     f"   Increment finish time set to: "
                     f"{self.setup.increment_finish} "
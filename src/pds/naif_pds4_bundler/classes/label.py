@@ -53,7 +53,7 @@ class PDSLabel(object):
             #
             # Needs to be built for several observers.
             #
-            if hasattr(setup, "secondary_observers"):
+            if setup.secondary_observers:
                 if len(setup.secondary_observers) == 1:
                     observers_text = f"{setup.observer} and {setup.secondary_observers[0]}"
                 else:
@@ -85,7 +85,7 @@ class PDSLabel(object):
             except BaseException:
                 self.PDS4_MISSION_LID = product.bundle.lid_reference
 
-        if hasattr(self.setup, "creation_date_time"):
+        if self.setup.creation_date_time is not None:
             creation_dt = self.setup.creation_date_time
             self.PRODUCT_CREATION_TIME = creation_dt
             self.PRODUCT_CREATION_DATE = creation_dt.split("T")[0]
@@ -112,7 +112,7 @@ class PDSLabel(object):
             #
             obs = ["{}".format(self.setup.observer)]
 
-            if hasattr(self.setup, "secondary_observers"):
+            if self.setup.secondary_observers:
                 sec_obs = self.setup.secondary_observers
                 if not isinstance(sec_obs, list):
                     sec_obs = [sec_obs]
@@ -126,7 +126,7 @@ class PDSLabel(object):
             #
             tar = [self.setup.target]
 
-            if hasattr(self.setup, "secondary_targets"):
+            if self.setup.secondary_targets:
                 sec_tar = self.setup.secondary_targets
                 if not isinstance(sec_tar, list):
                     sec_tar = [sec_tar]
@@ -1,26 +1,204 @@
 """List Class and Child Class Implementation."""
 import datetime
+import functools
 import glob
 import json
 import logging
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 from ..utils import check_badchar
 from ..utils import check_binary_endianness
 from ..utils import check_consecutive
 from ..utils import check_eol
 from ..utils import check_kernel_integrity
-from ..utils import check_list_duplicates
 from ..utils import compare_files
 from ..utils import extension_to_type
 from ..utils import extract_comment
 from ..utils import fill_template
 from ..utils import product_mapping
+from ..utils import scan_files
 from ..utils import spice_exception_handler
 from .log import error_message
 
+#
+# Buffer size used to concatenate the Kernel List files.
+#
+_COPY_BUFFER = 1 << 20
+
+#
+# Release number of a Kernel List file, e.g.: ``em16_release_03.kernel_list``.
+#
+_RELEASE_RE = re.compile(r"_(\d+)\.kernel_list$")
+
+#
+# Character sets of the kernel patterns that match a single character of the
+# kernel name.
+#
+_CHARACTER_SET_RE = re.compile(r"\[(?:0-9|a-z|A-Z|a-zA-Z)\]")
+
+#
+# Entry lines of a whole Kernel List, e.g.:
+# ``FILE             = spice_kernels/...``; provide the keyword and its value.
+#
+_ENTRY_RE = re.compile(
+    r"^[ \t]*(FILE|MAKLABEL_OPTIONS|DESCRIPTION)[ \t]*=[ \t]*(.*?)[ \t]*$",
+    re.MULTILINE,
+)
+
+#
+# Values of the FILE entries of a whole Kernel List.
+#
+_FILE_RE = re.compile(r"^[ \t]*FILE[ \t]*=[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
+
+def _combine_patterns(patterns):
+    """Combine compiled regular expressions in a single alternation.
+
+    The alternation matches a string if and only if any of the patterns
+    does, therefore it can be used to discard the strings that do not match
+    any pattern with a single search. If the patterns cannot be combined
+    --they define groups that would be renumbered or have conflicting
+    flags-- None is returned.
+
+    :param patterns: Compiled regular expressions
+    :type patterns: list
+    :return: Combined regular expression or None
+    :rtype: re.Pattern
+    """
+    if not patterns or any(pattern.groups for pattern in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+    except re.error:
+        return None
+
+
+def _iter_kernels(directory):
+    """Recursively iterate over the kernel files of a directory.
+
+    The files are the ones that ``glob.glob(f"{directory}/**/*.*",
+    recursive=True)`` would return, except meta-kernels: hidden files and
+    directories are skipped, symbolic links to directories are followed and
+    only file names with an extension are provided. Directories that cannot
+    be read are silently skipped.
+
+    :param directory: Kernels directory
+    :type directory: str
+    :return: Paths of the kernel files
+    :rtype: Iterator[str]
+    """
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    stack.append(entry.path)
+                elif "." in name and ".tm" not in name:
+                    yield entry.path
+
+
+def _kernel_pattern_indexes(patterns):
+    """Obtain the indexes to extract description values from kernel names.
+
+    For each description pattern element extracted from the kernel name,
+    the lengths of the kernel pattern parts before and after the element
+    are provided. Each character set of the pattern is counted as a single
+    character.
+
+    :param patterns: Description patterns of a kernel pattern
+    :type patterns: dict
+    :return: Lengths of the pattern parts for each pattern element
+    :rtype: dict
+    """
+    indexes = {}
+    if not patterns:
+        return indexes
+
+    for el, value in patterns.items():
+        if (
+            isinstance(value, dict)
+            and "@pattern" in value
+            and value["@pattern"].lower() == "kernel"
+        ):
+            #
+            # First Turn the regex set into a single character to be able
+            # to know were in the filename is.
+            #
+            patt_ker = _CHARACTER_SET_RE.sub("$", value["#text"])
+
+            #
+            # Split the resulting pattern and keep the length of each part.
+            #
+            indexes[el] = [len(element) for element in patt_ker.split(f"${el}")]
+
+    return indexes
+
+
+def _release_kernel_lists(directory, mission_acronym):
+    """List the release Kernel List files of a directory.
+
+    :param directory: Directory where the Kernel Lists are located
+    :type directory: str
+    :param mission_acronym: Mission acronym
+    :type mission_acronym: str
+    :return: Sorted paths of the Kernel Lists
+    :rtype: list
+    """
+    prefix = f"{mission_acronym}_release"
+    with os.scandir(directory) as entries:
+        return sorted(
+            entry.path
+            for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(".kernel_list")
+        )
+
+
+def _file_names(directory):
+    """Collect the names of the files of a directory tree.
+
+    The names are the ones that ``os.walk`` would provide: symbolic links to
+    directories are not followed and directories that cannot be read are
+    silently skipped.
+
+    :param directory: Directory to walk
+    :type directory: str
+    :return: Names of the files under the directory and its sub-directories
+    :rtype: set
+    """
+    return {entry.name for entry in scan_files(directory)}
+
+
+@functools.lru_cache(maxsize=8)
+def _read_mission_template(path, mtime):
+    """Read a PDS3 Mission Template file.
+
+    The modification time is part of the cache key, an updated template is
+    read again.
+
+    :param path: Path of the Mission Template
+    :type path: str
+    :param mtime: Modification time of the Mission Template in nanoseconds
+    :type mtime: int
+    :return: Contents of the Mission Template
+    :rtype: str
+    """
+    with open(path, "r") as o:
+        return o.read()
+
 
 class List(object):
     """Class to generate the List.
@@ -114,8 +292,46 @@ class KernelList(List):
         self.setup.re_config = re_config
         self.json_config = json_config
 
-        json_formatted_str = json.dumps(self.json_config, indent=2)
-        self.json_formatted_lst = json_formatted_str.split("\n")
+        #
+        # Compiled patterns used to match the release plan products: the
+        # kernel patterns followed by their mapping patterns if present
+        # --without duplicates--, and the ORBNUM file patterns.
+        #
+        plan_patterns = []
+        for pattern in json_config:
+            plan_patterns.append(pattern)
+            if "mapping" in json_config[pattern]:
+                plan_patterns.append(json_config[pattern]["mapping"])
+        plan_patterns = [re.compile(pattern) for pattern in dict.fromkeys(plan_patterns)]
+        self.plan_patterns = plan_patterns
+        self.plan_re = _combine_patterns(plan_patterns)
+
+        #
+        # Kernel List entry parameters for each kernel pattern: the compiled
+        # pattern, the description --the only mandatory field--, the
+        # MAKLABEL options, the description patterns, the mapping and the
+        # indexes of the description values extracted from kernel names.
+        #
+        self.pattern_table = [
+            (
+                re_pattern,
+                json_config[re_pattern.pattern]["description"],
+                json_config[re_pattern.pattern].get("mklabel_options", ""),
+                json_config[re_pattern.pattern].get("patterns", False),
+                json_config[re_pattern.pattern].get("mapping", ""),
+                _kernel_pattern_indexes(
+                    json_config[re_pattern.pattern].get("patterns", False)
+                ),
+            )
+            for re_pattern in re_config
+        ]
+
+        if self.setup.orbnum is not None:
+            self.orbnum_patterns = [
+                re.compile(orb["pattern"]) for orb in self.setup.orbnum
+            ]
+        else:
+            self.orbnum_patterns = []
 
     def read_plan(self, plan):
         """Read Release Plan from the main module input.
@@ -125,15 +341,6 @@ class KernelList(List):
         """
         kernels = []
 
-        #
-        # Add mapping kernel patterns in list.
-        #
-        patterns = []
-        for pattern in self.json_config:
-            patterns.append(pattern)
-            if "mapping" in self.json_config[pattern]:
-                patterns.append(self.json_config[pattern]["mapping"])
-
         #
         # If NPB runs in labeling mode, a single file can be specified
         # as a release plan. If so, a plan is generated.
@@ -145,7 +352,7 @@ class KernelList(List):
             )
             plan = self.setup.working_directory + os.sep + plan_name
             with open(plan, "w") as pl:
-                pl.write(plan.split(os.sep)[-1])
+                pl.write(plan.rpartition(os.sep)[2])
         elif plan.split(".")[-1] != "plan":
             error_message(
                 "Release plan requires *.plan extension. Single "
@@ -155,23 +362,24 @@ class KernelList(List):
         with open(plan, "r") as f:
             for line in f:
                 ker_matched = False
-                for pattern in patterns:
-                    if re.search(pattern, line):
-                        ker_line = re.search(pattern, line)
-                        kernels.append(ker_line.group(0))
-                        ker_matched = True
+                if self.plan_re is None or self.plan_re.search(line):
+                    for pattern in self.plan_patterns:
+                        ker_line = pattern.search(line)
+                        if ker_line:
+                            kernels.append(ker_line.group(0))
+                            ker_matched = True
+                            break
                 if not ker_matched:
                     #
                     # Add the orbnum files that need to be added.
                     # Match the pattern with the file.
                     #
-                    if hasattr(self.setup, "orbnum"):
-                        for orb in self.setup.orbnum:
-                            pattern = orb["pattern"]
-                            if re.search(pattern, line):
-                                ker_line = re.search(pattern, line)
-                                kernels.append(ker_line.group(0))
-                                ker_matched = True
+                    for pattern in self.orbnum_patterns:
+                        ker_line = pattern.search(line)
+                        if ker_line:
+                            kernels.append(ker_line.group(0))
+                            ker_matched = True
+                            break
                     #
                     # Display the lines that have not been match unless
                     # they only contain blank spaces.
@@ -222,31 +430,36 @@ class KernelList(List):
             for dir in self.setup.kernels_directory:
                 logging.info(f"   {dir}")
 
-            kernels_in_dir = []
-            for dir in self.setup.kernels_directory:
-                kernels_in_dir += glob.glob(f"{dir}/**/*.*", recursive=True)
             #
-            # Filter out the meta-kernels from the automatically generated
-            # list.
+            # The meta-kernels are filtered out from the automatically
+            # generated list.
             #
-            kernels_in_dir = [item for item in kernels_in_dir if ".tm" not in item]
-            kernels_in_dir.sort()
+            kernels_in_dir = []
+            for dir in self.setup.kernels_directory:
+                kernels_in_dir += _iter_kernels(dir)
 
         #
         # Filter the kernels with the patterns in the kernel list from the
         # configuration. The patterns are present in the json_config
         # attribute dictionary.
         #
-        patterns = []
-        for pattern in self.json_config:
-            patterns.append(pattern)
-            if "mapping" in self.json_config[pattern]:
-                patterns.append(self.json_config[pattern]["mapping"])
+        # Only the matching kernels are sorted, by path, to keep the
+        # order of the plan independent of the traversal order.
+        #
+        patterns = self.plan_patterns
 
+        kernels_matched = []
         for kernel in kernels_in_dir:
+            name = kernel.rpartition(os.sep)[2]
+            if self.plan_re is not None and not self.plan_re.match(name):
+                continue
             for pattern in patterns:
-                if re.match(pattern, kernel.split(os.sep)[-1]):
-                    kernels.append(kernel.split(os.sep)[-1])
+                if pattern.match(name):
+                    kernels_matched.append(kernel)
+                    break
+        kernels_matched.sort()
+
+        kernels += [kernel.rpartition(os.sep)[2] for kernel in kernels_matched]
 
         #
         # Sort the meta-kernels that need to be added if not running
@@ -255,13 +468,13 @@ class KernelList(List):
         # First we look into the configuration file. If a meta-kernel is
         # present, it is the one that will be used.
         #
-        if hasattr(self.setup, "mk_inputs") and (self.setup.args.faucet != "labels"):
+        if (self.setup.mk_inputs is not None) and (self.setup.args.faucet != "labels"):
             if not isinstance(self.setup.mk_inputs["file"], list):
                 mks = [self.setup.mk_inputs["file"]]
             else:
                 mks = self.setup.mk_inputs["file"]
             for mk in mks:
-                mk_new_name = mk.split(os.sep)[-1]
+                mk_new_name = mk.rpartition(os.sep)[2]
                 if os.path.isfile(mk):
                     mk_path = mk
                 else:
@@ -279,13 +492,22 @@ class KernelList(List):
             # If no meta-kernel was provided via configuration, try to
             # infer the on that needs to be generated.
             #
-            kernels_in_dir = glob.glob(
-                f"{self.setup.bundle_directory}/**/*", recursive=True
-            )
+            # Only the names of the files with the meta-kernel extension
+            # under ``mk`` directories are collected; hidden files and
+            # directories are skipped.
+            #
             mks_in_dir = []
-            for mk in kernels_in_dir:
-                if "/mk/" in mk and ".tm" in mk.lower():
-                    mks_in_dir.append(mk.split(os.sep)[-1])
+            for root, dirs, files in os.walk(
+                self.setup.bundle_directory, followlinks=True
+            ):
+                dirs[:] = [dir for dir in dirs if not dir.startswith(".")]
+                if "mk" in root.split(os.sep):
+                    mks_in_dir += [
+                        name
+                        for name in files
+                        if not name.startswith(".")
+                        and name.lower().endswith(".tm")
+                    ]
 
             mks_in_dir.sort()
 
@@ -305,7 +527,7 @@ class KernelList(List):
                 if kernels:
                     for pattern in patterns:
                         mk_name = mks_in_dir[-1]
-                        if re.match(pattern, mk_name):
+                        if pattern.match(mk_name):
                             version = re.findall(r"_v[0-9]+", mk_name)[0]
                             new_version = "_v" + str(int(version[2:]) + 1).zfill(
                                 len(version) - 2
@@ -333,10 +555,11 @@ class KernelList(List):
         if self.setup.orbnum_directory and (self.setup.args.faucet != "labels"):
             orbnums_in_dir = glob.glob(f"{self.setup.orbnum_directory}/*")
             for orbnum_in_dir in orbnums_in_dir:
-                for orbnum in self.setup.orbnum:
-                    if re.match(orbnum["pattern"], orbnum_in_dir.split(os.sep)[-1]):
+                name = orbnum_in_dir.rpartition(os.sep)[2]
+                for pattern in self.orbnum_patterns:
+                    if pattern.match(name):
                         logging.warning(f"-- Plan will include {orbnum_in_dir}")
-                        kernels.append(orbnum_in_dir.split(os.sep)[-1])
+                        kernels.append(name)
 
         #
         # The kernel list is complete.
@@ -391,40 +614,39 @@ class KernelList(List):
 
         list_dictionary = vars(self)
 
+        #
+        # Comment areas of the kernels read during the list generation; a
+        # kernel comment is only read once even if several pattern elements
+        # are extracted from it.
+        #
+        comments = {}
+
         fill_template(
             self, self.setup.working_directory + os.sep + list_name, list_dictionary
         )
 
         with open(self.setup.working_directory + os.sep + list_name, "a+") as f:
 
+            #
+            # The entries are accumulated and written at once.
+            #
+            entries = []
             for kernel in self.kernel_list:
                 ker_added_to_list = False
                 #
                 # Find the correspondence of the filename in the JSON file
                 #
-                for pattern in self.re_config:
+                for (
+                    pattern,
+                    description,
+                    options,
+                    patterns,
+                    mapping,
+                    kernel_indexes,
+                ) in self.pattern_table:
 
                     if pattern.match(kernel):
 
-                        #
-                        # Description is the only mandatory field.
-                        #
-                        description = self.json_config[pattern.pattern]["description"]
-                        try:
-                            options = self.json_config[pattern.pattern][
-                                "mklabel_options"
-                            ]
-                        except BaseException:
-                            options = ""
-                        try:
-                            patterns = self.json_config[pattern.pattern]["patterns"]
-                        except BaseException:
-                            patterns = False
-                        try:
-                            mapping = self.json_config[pattern.pattern]["mapping"]
-                        except BaseException:
-                            mapping = ""
-
                         #
                         # "options" and "descriptions" require to substitute parameters derived from the filenames
                         # themselves or from the comments of the kernel.
@@ -442,29 +664,9 @@ class KernelList(List):
                                     if ("@pattern" in patterns[el] and patterns[el]["@pattern"].lower() == "kernel"):
                                         #
                                         # When extracted from the filename, the keyword  is matched in between patterns.
+                                        # The length of each part of the pattern is obtained with the configuration.
                                         #
-
-                                        #
-                                        # First Turn the regex set into a single character to be able to know were in
-                                        # the filename is.
-                                        #
-                                        patt_ker = value["#text"].replace("[0-9]", "$")
-                                        patt_ker = patt_ker.replace("[a-z]", "$")
-                                        patt_ker = patt_ker.replace("[A-Z]", "$")
-                                        patt_ker = patt_ker.replace("[a-zA-Z]", "$")
-
-                                        #
-                                        # Split the resulting pattern to build up the indexes to extract the value
-                                        # from the kernel name.
-                                        #
-                                        patt_split = patt_ker.split(f"${el}")
-
-                                        #
-                                        # Create a list with the length of each part.
-                                        #
-                                        indexes = []
-                                        for element in patt_split:
-                                            indexes.append(len(element))
+                                        indexes = kernel_indexes[el]
 
                                         #
                                         # Extract the value with the index from the kernel name.
@@ -491,9 +693,12 @@ class KernelList(List):
                                         #
                                         # So far this method is implemented to accomodate MRO files
                                         #
-                                        comment = extract_comment(self.setup.kernels_directory[0] +
-                                                                  f"/{ extension_to_type(kernel.split('.')[-1])}/" +
-                                                                  kernel)
+                                        comment_path = (self.setup.kernels_directory[0] +
+                                                        f"/{ extension_to_type(kernel.split('.')[-1])}/" +
+                                                        kernel)
+                                        if comment_path not in comments:
+                                            comments[comment_path] = extract_comment(comment_path)
+                                        comment = comments[comment_path]
 
                                         for line in comment:
                                             if patterns[el]["#text"] in line:
@@ -560,30 +765,31 @@ class KernelList(List):
                         else:
                             kerdir = "spice_kernels/" + extension_to_type(kernel)
 
-                        if not options:
-                            options = ""
-
-                        f.write(f"FILE             = {kerdir}/{kernel}\n")
                         #
-                        # Introduced to avoid trailing white space.
+                        # The empty options line is introduced to avoid
+                        # trailing white space.
                         #
-                        if not options:
-                            f.write("MAKLABEL_OPTIONS =\n")
-                        else:
-                            f.write(f"MAKLABEL_OPTIONS = {options}\n")
-                        f.write(f"DESCRIPTION      = {description}\n")
+                        entries.append(
+                            f"FILE             = {kerdir}/{kernel}\n"
+                            + (f"MAKLABEL_OPTIONS = {options}\n" if options else "MAKLABEL_OPTIONS =\n")
+                            + f"DESCRIPTION      = {description}\n"
+                        )
 
                         if mapping:
 
                             logging.info(f"-- Mapping {kernel} with {mapping}")
-                            f.write(f"MAPPING          = {mapping}\n")
+                            entries.append(f"MAPPING          = {mapping}\n")
 
                         ker_added_to_list = True
 
                 if not ker_added_to_list:
-                    f.write(f"FILE             = miscellaneous/orbnum/{kernel}\n")
-                    f.write("MAKLABEL_OPTIONS = N/A\n")
-                    f.write("DESCRIPTION      = N/A\n")
+                    entries.append(
+                        f"FILE             = miscellaneous/orbnum/{kernel}\n"
+                        "MAKLABEL_OPTIONS = N/A\n"
+                        "DESCRIPTION      = N/A\n"
+                    )
+
+            f.write("".join(entries))
 
         self.list_name = list_name
 
@@ -610,16 +816,15 @@ class KernelList(List):
         except shutil.SameFileError:
             pass
 
-        self.list_name = kernel_list.split(os.sep)[-1]
+        self.list_name = kernel_list.rpartition(os.sep)[2]
 
         #
         # Generate the kernel list attribute, necessary for the validation.
         #
-        kernels = []
         with open(kernel_list, "r") as lst:
-            for line in lst:
-                if "FILE             =" in line:
-                    kernels.append(line.split(os.sep)[-1][:-1])
+            kernels = [
+                file.rpartition("/")[2] for file in _FILE_RE.findall(lst.read())
+            ]
 
         self.kernel_list = kernels
 
@@ -636,29 +841,24 @@ class KernelList(List):
         if not self.setup.args.silent and not self.setup.args.verbose:
             print("-- " + line.split(" - ")[-1] + ".")
 
-        kernel_lists = glob.glob(
-            self.setup.working_directory
-            + os.sep
-            + f"{self.setup.mission_acronym}_release*"
-            f".kernel_list"
-        )
-
         #
         # Sort list in inverse order in such way that the DATASETID is
         # obtained from the header of the latest list.
         #
-        kernel_lists.sort(reverse=True)
+        kernel_lists = _release_kernel_lists(
+            self.setup.working_directory, self.setup.mission_acronym
+        )
+        kernel_lists.reverse()
 
         complete_list = f"{self.setup.mission_acronym}_complete.kernel_list"
 
         release_list = []
-        with open(self.setup.working_directory + os.sep + complete_list, "w+") as c:
+        with open(self.setup.working_directory + os.sep + complete_list, "wb") as c:
             for kernel_list in kernel_lists:
                 logging.info(f"-- Adding {kernel_list}")
-                release_list.append(int(kernel_list.replace("_", ".").split(".")[-3]))
-                with open(kernel_list, "r") as lst:
-                    for line in lst:
-                        c.write(line)
+                release_list.append(int(_RELEASE_RE.search(kernel_list).group(1)))
+                with open(kernel_list, "rb") as lst:
+                    shutil.copyfileobj(lst, c, _COPY_BUFFER)
 
         if not check_consecutive(release_list):
             logging.warning(f"-- Incomplete Kernel lists available: {release_list}")
@@ -689,35 +889,41 @@ class KernelList(List):
         num_desc = 0
 
         ker_in_list = []
-        opt_in_list = []
+        ker_in_list_set = set()
+        ker_duplicates = []
+        opt_in_list = set()
 
         with open(self.setup.working_directory + os.sep + self.list_name, "r") as lst:
 
             #
             # Check that the list has the same number of FILE,
-            # MAKLABEL_OPTIONS, and DESCRIPTION entries
+            # MAKLABEL_OPTIONS, and DESCRIPTION entries. Each entry line
+            # starts with its keyword followed by ``=``.
             #
-            for line in lst:
-
-                if ("FILE" in line) and (line.split("=")[-1].strip()):
+            for keyword, value in _ENTRY_RE.findall(lst.read()):
+                if keyword == "FILE" and value:
                     num_file += 1
                     #
                     # We add kernels to compare plan and list and to look
                     # for duplicates.
                     #
-                    ker_in_list.append(line.split("/")[-1].strip())
+                    ker = value.rpartition("/")[2]
+                    if ker in ker_in_list_set:
+                        ker_duplicates.append(ker)
+                    else:
+                        ker_in_list_set.add(ker)
+                    ker_in_list.append(ker)
 
-                elif "OPTIONS" in line:
+                elif keyword == "MAKLABEL_OPTIONS":
                     num_opti += 1
                     #
                     # We add options to display and compare to template
                     #
-                    options = line.split("=")[-1].split()
-                    for option in options:
-                        if option != "None":
-                            opt_in_list.append(option)
+                    opt_in_list.update(
+                        option for option in value.split() if option != "None"
+                    )
 
-                elif ("DESCRIPTION" in line) and (line.split("=")[-1].strip()):
+                elif keyword == "DESCRIPTION" and value:
                     num_desc += 1
 
             if (num_file != num_opti) or (num_opti != num_desc):
@@ -732,7 +938,7 @@ class KernelList(List):
                     f"-- Display {self.setup.mission_name} kernel list "
                     f"configuration file to double-check."
                 )
-                for line in self.json_formatted_lst:
+                for line in json.dumps(self.json_config, indent=2).split("\n"):
                     logging.info(line)
                 logging.error("")
 
@@ -748,8 +954,10 @@ class KernelList(List):
             #
             # Check list for duplicate entries
             #
-            if check_list_duplicates(ker_in_list):
-                error_message("List contains duplicates.")
+            if ker_duplicates:
+                error_message(
+                    f"List contains duplicates: {', '.join(ker_duplicates)}."
+                )
 
             #
             # Check that all files listed are available in OPS area;
@@ -760,23 +968,22 @@ class KernelList(List):
             for dir in self.setup.kernels_directory:
                 logging.info(f"   {dir}")
 
-            present = False
+            #
+            # We cannot assume that the file is under a certain
+            # directory, it can be in any sub-directory. The names of all
+            # the files are indexed with a single walk per directory; the
+            # directories are walked concurrently.
+            #
+            files_in_dir = set()
+            with ThreadPoolExecutor(
+                max_workers=max(len(self.setup.kernels_directory), 1)
+            ) as executor:
+                for names in executor.map(_file_names, self.setup.kernels_directory):
+                    files_in_dir |= names
+
             all_present = True
             for ker in ker_in_list:
-                for dir in self.setup.kernels_directory:
-                    #
-                    # We cannot assume that the file is under a certain
-                    # directory, it can be in any sub-directory.
-                    #
-                    file = [
-                        os.path.join(root, name)
-                        for root, dirs, files in os.walk(dir)
-                        for name in files
-                        if name == ker
-                    ]
-                    if file:
-                        present = True
-                if not present:
+                if ker not in files_in_dir:
                     if ".tm" in ker:
                         logging.info(f"     {ker} not present as expected.")
                     else:
@@ -791,20 +998,24 @@ class KernelList(List):
             #
             # Check that no file is in the final area.
             #
-            present = False
             logging.info(
                 f"-- Checking that kernels are present in "
                 f"{self.setup.bundle_directory}:"
             )
-            for ker in ker_in_list:
+            final_directory = (
+                f"{self.setup.bundle_directory}/"
+                f"{self.setup.mission_acronym}_spice/spice_kernels/"
+            )
+            ker_in_final = [
+                ker
+                for ker in ker_in_list
                 if os.path.isfile(
-                    self.setup.bundle_directory
-                    + f"/{self.setup.mission_acronym}_spice/"
-                    f"spice_kernels/" + extension_to_type(ker) + os.sep + ker
-                ):
-                    present = True
-                    logging.warning(f"     {ker} present.")
-            if not present:
+                    final_directory + extension_to_type(ker) + os.sep + ker
+                )
+            ]
+            for ker in ker_in_final:
+                logging.warning(f"     {ker} present.")
+            if not ker_in_final:
                 logging.info("     No kernels present in final area.")
             logging.info("")
 
@@ -813,8 +1024,7 @@ class KernelList(List):
             # used
             #
             if self.setup.pds_version == '3':
-                opt_in_list = list(dict.fromkeys(opt_in_list))
-                opt_in_list.sort()
+                opt_in_list = sorted(opt_in_list)
                 logging.info("-- Display all the MAKLABEL_OPTIONS:")
                 for option in opt_in_list:
                     logging.info(f"     {option}")
@@ -843,31 +1053,39 @@ class KernelList(List):
             #
             logging.info("-- Checking for duplicates in complete kernel list:")
 
-            kernel_lists = glob.glob(
-                self.setup.working_directory
-                + os.sep
-                + f"{self.setup.mission_acronym}_release*"
-                f".kernel_list"
+            kernel_lists = _release_kernel_lists(
+                self.setup.working_directory, self.setup.mission_acronym
             )
-            kernel_lists.sort()
 
-            ker_in_list = []
+            #
+            # A single set of kernels is used across all the lists.
+            #
+            ker_in_lists = set()
+            ker_duplicates = []
             for kernel_list in kernel_lists:
+                logging.info(f"     Adding {kernel_list} in check.")
 
-                with open(kernel_list, "r") as lst:
-
-                    #
-                    # Check that the list has the same number of FILE,
-                    # MAKLABEL_OPTIONS, and DESCRIPTION entries
-                    #
-                    logging.info(f"     Adding {kernel_list} in check.")
+                #
+                # The current list has already been read.
+                #
+                if kernel_list.rpartition(os.sep)[2] == self.list_name:
+                    files = ker_in_list
+                else:
+                    with open(kernel_list, "r") as lst:
+                        files = _FILE_RE.findall(lst.read())
 
-                    for line in lst:
-                        if ("FILE" in line) and (line.split("=")[-1].strip()):
-                            ker_in_list.append(line.split("/")[-1].strip())
+                for file in files:
+                    if file:
+                        ker = file.rpartition("/")[2]
+                        if ker in ker_in_lists:
+                            ker_duplicates.append(ker)
+                        else:
+                            ker_in_lists.add(ker)
 
-            if check_list_duplicates(ker_in_list):
-                error_message("List contains duplicates.")
+            if ker_duplicates:
+                error_message(
+                    f"List contains duplicates: {', '.join(ker_duplicates)}."
+                )
             else:
                 logging.info("     List contains no duplicates.")
             logging.info("")
@@ -879,12 +1097,15 @@ class KernelList(List):
             logging.info("-- Comparing current list with previous list:")
 
             logging.info("")
-            fromfile = kernel_lists[-1]
-            try:
+            if len(kernel_lists) > 1:
+                fromfile = kernel_lists[-1]
                 tofile = kernel_lists[-2]
                 dir = self.setup.working_directory
-                compare_files(fromfile, tofile, dir, self.setup.diff)
-            except BaseException:
+                try:
+                    compare_files(fromfile, tofile, dir, self.setup.diff)
+                except (OSError, UnicodeDecodeError) as err:
+                    logging.error(f"-- Lists could not be compared: {err}")
+            else:
                 logging.error("-- Previous list not available.")
 
     def validate_complete(self):
@@ -908,8 +1129,9 @@ class KernelList(List):
         num_opti = 0
         num_desc = 0
 
-        ker_in_list = []
-        opt_in_list = []
+        ker_in_list = set()
+        ker_duplicates = []
+        opt_in_list = set()
 
         with open(
             self.setup.working_directory + os.sep + self.complete_list, "r"
@@ -921,26 +1143,27 @@ class KernelList(List):
             #
             logging.info("-- Checking list number of entries coherence:")
 
-            for line in lst:
-
-                if ("FILE" in line) and (line.split("=")[-1].strip()):
+            for keyword, value in _ENTRY_RE.findall(lst.read()):
+                if keyword == "FILE" and value:
                     num_file += 1
                     #
                     # We add kernels to compare plan and list and to look
                     # for duplicates.
                     #
-                    ker_in_list.append(line.split("/")[-1].strip())
+                    ker = value.rpartition("/")[2]
+                    if ker in ker_in_list:
+                        ker_duplicates.append(ker)
+                    else:
+                        ker_in_list.add(ker)
 
-                elif "OPTIONS" in line:
+                elif keyword == "MAKLABEL_OPTIONS":
                     num_opti += 1
                     #
                     # We add options to display and compare to template
                     #
-                    options = line.split("=")[-1].split()
-                    for option in options:
-                        opt_in_list.append(option)
+                    opt_in_list.update(value.split())
 
-                elif ("DESCRIPTION" in line) and (line.split("=")[-1].strip()):
+                elif keyword == "DESCRIPTION" and value:
                     num_desc += 1
 
             if (num_file != num_opti) or (num_opti != num_desc):
@@ -955,7 +1178,7 @@ class KernelList(List):
                     f"-- Display {self.setup.mission_name} kernel list "
                     f"configuration file to double-check."
                 )
-                for line in self.json_formatted_lst:
+                for line in json.dumps(self.json_config, indent=2).split("\n"):
                     logging.info(line)
                 logging.error("")
 
@@ -968,8 +1191,10 @@ class KernelList(List):
             # Check list for duplicate entries
             #
             logging.info("-- Checking for duplicates in kernel list:")
-            if check_list_duplicates(ker_in_list):
-                error_message("List contains duplicates.")
+            if ker_duplicates:
+                error_message(
+                    f"List contains duplicates: {', '.join(ker_duplicates)}."
+                )
             else:
                 logging.info("     List contains no duplicates.")
             logging.info("")
@@ -978,8 +1203,7 @@ class KernelList(List):
             # Display all the MAKLABL_OPTIONS used if archive is PDS3.
             #
             if self.setup.pds_version == "3":
-                opt_in_list = list(dict.fromkeys(opt_in_list))
-                opt_in_list.sort()
+                opt_in_list = sorted(opt_in_list)
                 logging.info("-- Display all the MAKLABEL_OPTIONS:")
                 for option in opt_in_list:
                     logging.info(f"     {option}")
@@ -997,15 +1221,16 @@ class KernelList(List):
                     self.setup.root_dir + f"/config/{self.setup.mission_acronym}"
                     f"_mission_template.pds"
                 )
-                with open(template, "r") as o:
-                    template_lines = o.readlines()
+                template_text = _read_mission_template(
+                    template, os.stat(template).st_mtime_ns
+                )
 
+                #
+                # Options never span lines, therefore the whole template is
+                # searched at once.
+                #
                 for option in opt_in_list:
-                    present = False
-                    for line in template_lines:
-                        if "--" + option in line:
-                            present = True
-                    if present:
+                    if "--" + option in template_text:
                         logging.info(f"     {option} is present.")
                     else:
                         error_message(f"{option} not in template.")
@@ -1066,26 +1291,42 @@ class KernelList(List):
             if (".nrb" in product.lower()) or (".orb" in product.lower()):
                 origin_paths.append(self.setup.orbnum_directory + os.sep + product)
             else:
+                #
+                # The mapping only depends on the product, resolve it at
+                # most once and only if a kernel directory misses it.
+                #
+                mapping = None
+                mapping_resolved = False
                 for directory in self.setup.kernels_directory:
-                    try:
-                        file = [
-                            os.path.join(root, ker)
-                            for root, dirs, files in os.walk(directory)
-                            for ker in files
-                            if product == ker
-                        ]
-                        origin_paths.append(file[0])
-                    except BaseException:
-                        try:
-                            file = [
-                                os.path.join(root, ker)
-                                for root, dirs, files in os.walk(directory)
-                                for ker in files
-                                if product_mapping(product, self.setup, cleanup=False) == ker
-                            ]
-                            origin_paths.append(file[0])
-                        except BaseException:
-                            pass
+                    path = next(
+                        (
+                            entry.path
+                            for entry in scan_files(directory)
+                            if entry.name == product
+                        ),
+                        None,
+                    )
+                    if path is None:
+                        if not mapping_resolved:
+                            mapping_resolved = True
+                            try:
+                                mapping = product_mapping(
+                                    product, self.setup, cleanup=False
+                                )
+                            except Exception:
+                                mapping = None
+                        if not mapping:
+                            continue
+                        path = next(
+                            (
+                                entry.path
+                                for entry in scan_files(directory)
+                                if entry.name == mapping
+                            ),
+                            None,
+                        )
+                    if path is not None:
+                        origin_paths.append(path)
 
             if not origin_paths and ".tm" not in product.lower():
                 product_errors[product].append("Product not present in any kernel directory(ies)")
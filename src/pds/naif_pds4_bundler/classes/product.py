@@ -35,6 +35,7 @@ from ..utils import pck_coverage
 from ..utils import product_mapping
 from ..utils import replace_string_in_file
 from ..utils import safe_make_directory
+from ..utils import scan_files
 from ..utils import spice_exception_handler
 from ..utils import spk_coverage
 from ..utils import string_in_file
@@ -94,7 +95,7 @@ class Product(object):
         else:
             archive_dir = f"{self.setup.volume_id}/"
 
-        if hasattr(self.setup, "creation_date_time"):
+        if self.setup.creation_date_time is not None:
             self.creation_time = self.setup.creation_date_time
         else:
             self.creation_time = creation_time(format=self.setup.date_format)
@@ -227,18 +228,18 @@ class SpiceKernelProduct(Product):
         if not os.path.isfile(product_path + self.name):
             origin_path = ''
             for directory in self.setup.kernels_directory:
-                file = [
-                    os.path.join(root, ker)
-                    for root, dirs, files in os.walk(directory)
-                    for ker in files
-                    if name == ker
-                ]
-
                 #
                 # If the file exists save the path and escape the loop.
                 #
-                if file:
-                    origin_path = file[0]
+                origin_path = next(
+                    (
+                        entry.path
+                        for entry in scan_files(directory)
+                        if entry.name == name
+                    ),
+                    '',
+                )
+                if origin_path:
                     self.new_product = True
                     break
 
@@ -247,20 +248,19 @@ class SpiceKernelProduct(Product):
             # loop to see if the file needs mapping.
             #
             if not origin_path:
+                mapping = product_mapping(self.name, self.setup)
                 for directory in self.setup.kernels_directory:
-                    file = [
-                        os.path.join(root, ker)
-                        for root, dirs, files in os.walk(directory)
-                        for ker in files
-                        if product_mapping(self.name, self.setup) == ker
-                    ]
-
-                    if file:
-                        origin_path = file[0]
+                    origin_path = next(
+                        (
+                            entry.path
+                            for entry in scan_files(directory)
+                            if entry.name == mapping
+                        ),
+                        '',
+                    )
+                    if origin_path:
                         self.new_product = True
-                        logging.info(
-                            f"-- Mapping {product_mapping(self.name, self.setup)} "
-                            f"with {self.name}")
+                        logging.info(f"-- Mapping {mapping} with {self.name}")
                         break
 
             #
@@ -355,7 +355,7 @@ class SpiceKernelProduct(Product):
                 if self.name in line:
                     get_token = True
                 if get_token and "DESCRIPTION" in line:
-                    description = line.split("=")[-1].strip()
+                    description = line.partition("=")[2].strip()
                     get_token = False
 
         if not description:
@@ -390,7 +390,7 @@ class SpiceKernelProduct(Product):
                 if self.name in line:
                     get_token = True
                 if get_token and "MAKLABEL_OPTIONS" in line:
-                    maklabel_options = line.split("=")[-1].strip().split()
+                    maklabel_options = line.partition("=")[2].strip().split()
                     get_token = False
 
         if not maklabel_options:
@@ -603,7 +603,7 @@ class MetaKernelProduct(Product):
         self.AUTHOR = self.setup.producer_name
         self.MISSION_NAME = self.setup.mission_name
 
-        if hasattr(self.setup, "creation_date_time"):
+        if self.setup.creation_date_time is not None:
             self.MK_CREATION_DATE = current_date(date=self.setup.creation_date_time)
         else:
             self.MK_CREATION_DATE = current_date()
@@ -1335,8 +1335,6 @@ class MetaKernelProduct(Product):
         if "coverage_kernels" in self.mk_setup:
             coverage_kernels = self.mk_setup["coverage_kernels"]
             patterns = coverage_kernels["pattern"]
-            if not isinstance(patterns, list):
-                patterns = [patterns]
 
             #
             # It is assumed that the coverage kernel is present in the
@@ -1491,12 +1489,12 @@ class MetaKernelProduct(Product):
 
                 return
             else:
-                if hasattr(self.setup, "increment_start"):
+                if self.setup.increment_start is not None:
                     start_time = self.setup.increment_start
                 else:
                     start_time = self.setup.mission_start
 
-                if hasattr(self.setup, "increment_finish"):
+                if self.setup.increment_finish is not None:
                     stop_time = self.setup.increment_finish
                 else:
                     stop_time = self.setup.mission_finish
@@ -1516,7 +1514,7 @@ class MetaKernelProduct(Product):
             # to be corrected for the increment start and stop times provided
             # via configuration.
             #
-            if hasattr(self.setup, "increment_start"):
+            if self.setup.increment_start is not None:
                 if hasattr(self, "year"):
                     #
                     # Check if the increment start year is the same as the yearly
@@ -1533,7 +1531,7 @@ class MetaKernelProduct(Product):
                                     f"increment start from configuration file to: {start_time}"
                                     )
 
-            if hasattr(self.setup, "increment_finish"):
+            if self.setup.increment_finish is not None:
                 if hasattr(self, "year"):
                     #
                     # Check if the increment finish year is the same as the yearly
@@ -3889,6 +3887,13 @@ class ChecksumProduct(Product):
         # history.
         #
         if history and self.setup.pds_version == "4":
+            #
+            # The checksum registries are listed once for all the products
+            # of the release.
+            #
+            checksum_registries = glob.glob(
+                f"{self.setup.working_directory}/*.checksum"
+            )
             for product in history[1]:
                 path = (
                         self.setup.bundle_directory
@@ -3903,7 +3908,7 @@ class ChecksumProduct(Product):
                 checksum = ""
                 if ".xml" not in product:
                     checksum = checksum_from_registry(
-                        path, self.setup.working_directory
+                        path, self.setup.working_directory, checksum_registries
                     )
                     if not checksum:
                         checksum = checksum_from_label(path)
@@ -1,25 +1,232 @@
 """Setup Class Implementation."""
+import bisect
 import datetime
+import errno
+import functools
 import glob
+import io
 import logging
 import os
 import re
 import shutil
+import stat
 import sys
 from os.path import dirname
-from pathlib import Path
 from xml.etree import cElementTree as ET
 
-import requests
 import spiceypy
-import xmlschema
 
 from ..utils import etree_to_dict
 from ..utils import kernel_name
+from ..utils import scan_files
 from ..utils import spice_exception_handler
 from .log import error_message
 from .object import Object
 
+#
+# Patterns used to validate the configuration parameters formats.
+#
+_RELEASE_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_INFOMOD2_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}\.[0-9]{3}Z")
+_MAKLABEL_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}Z")
+_IM_RE = re.compile(r"[0-9]+[.][0-9]+[.][0-9]+[.][0-9]+")
+
+#
+# Characters used for each Information Model version number in the
+# short version of the IM, e.g.: 1.11.0.0 is 1B00.
+#
+_IM_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+#
+# Entries of a previous run File List that are not removed from the staging
+# and final areas when clearing the run.
+#
+_CLEAR_SKIP = (".plan", ".kernel_list")
+
+#
+# Buffer size used to write the run by-product File List and Checksum
+# Registry.
+#
+_WRITE_BUFFER = 1 << 20
+
+#
+# Configuration elements that are always loaded as a list, even if only one
+# of them is present in the configuration file.
+#
+_CONFIG_LISTS = frozenset(
+    (
+        "secondary_observers/observer",
+        "secondary_targets/target",
+        "directories/kernels_directory",
+        "kernel_list/kernel",
+        "meta-kernel/mk",
+        "coverage_kernels/pattern",
+        "mk/name",
+        "orbit_number_file/orbnum",
+    )
+)
+
+
+def _is_dir(path):
+    """Check if a path is an existing directory with a single stat call.
+
+    :param path: Path to check
+    :type path: str
+    :return: True if the path is an existing directory
+    :rtype: bool
+    """
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _parse_im(version):
+    """Parse an Information Model version into its version numbers.
+
+    :param version: Information Model version, e.g.: 1.5.0.0
+    :type version: str
+    :return: Information Model version numbers, e.g.: (1, 5, 0, 0)
+    :rtype: tuple
+    """
+    return tuple(int(x) for x in version.split(".")[:4])
+
+
+def _schema_value(version):
+    """Convert an Information Model version into a comparable value.
+
+    Each version number is packed in 16 bits of an integer.
+
+    :param version: Information Model version numbers
+    :type version: tuple
+    :return: Information Model version value
+    :rtype: int
+    """
+    return (version[0] << 48) | (version[1] << 32) | (version[2] << 16) | version[3]
+
+
+def _schema_float(version):
+    """Convert an Information Model version into its float value.
+
+    The float value is used by the NPB classes to evaluate element values
+    that depend on the IM, e.g.: 1.14.0.0 is 1014000000.0.
+
+    :param version: Information Model version numbers
+    :type version: tuple
+    :return: Information Model version float value
+    :rtype: float
+    """
+    return float(
+        f"{version[0]:03d}"
+        f"{version[1]:03d}"
+        f"{version[2]:03d}"
+        f"{version[3]:03d}"
+    )
+
+
+def _release_number(path, separator):
+    """Extract the release number from a bundle label or a kernel list name.
+
+    :param path: Bundle label or kernel list path
+    :type path: str
+    :param separator: String that precedes the release number in the name
+    :type separator: str
+    :return: Release number, -1 if the name does not provide one
+    :rtype: int
+    """
+    try:
+        return int(path.split(separator)[-1].split(".")[0])
+    except ValueError:
+        return -1
+
+
+@functools.lru_cache(maxsize=None)
+def _configuration_schema():
+    """Load the XML Schema of the NPB configuration file.
+
+    xmlschema is imported here to avoid its import cost when the module is
+    imported but no configuration file is loaded. The schema is cached.
+
+    :return: NPB configuration file XML Schema
+    :rtype: xmlschema.XMLSchema11
+    """
+    import xmlschema
+
+    return xmlschema.XMLSchema11(dirname(__file__) + "/../data/configuration.xsd")
+
+
+@functools.lru_cache(maxsize=None)
+def _list_template_schemas(root_dir):
+    """List the Information Models of the NPB built-in label templates.
+
+    The built-in templates are not modified at runtime, therefore the
+    result is cached.
+
+    :param root_dir: NPB root directory
+    :type root_dir: str
+    :return: Information Models and their values, sorted by increasing value
+    :rtype: tuple
+    """
+    schemas = [
+        os.path.basename(x[:-1]) for x in glob.glob(f"{root_dir}templates/*/")
+    ]
+    schemas.remove("pds3")
+    schemas.sort(key=lambda schema: _schema_value(_parse_im(schema)))
+
+    return (
+        tuple(schemas),
+        tuple(_schema_value(_parse_im(schema)) for schema in schemas),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _list_template_files(directory):
+    """List the files of a NPB built-in label templates directory.
+
+    The listing is cached per ``directory`` argument, so it must only be
+    called with directories under the NPB ``templates`` root; user
+    provided templates directories are to be listed directly.
+
+    :param directory: Built-in templates directory
+    :type directory: str
+    :return: Template file names
+    :rtype: tuple
+    """
+    return tuple(os.listdir(directory))
+
+
+def _remove_files(paths):
+    """Remove files scanning each of their parent directories only once.
+
+    The files are grouped by parent directory; each directory is listed with
+    a single ``os.scandir`` call and only the matching entries are unlinked.
+
+    :param paths: Paths of the files to remove
+    :type paths: list
+    :return: Paths of the files that were not found, in input order
+    :rtype: list
+    """
+    targets = {}
+    for path in paths:
+        directory, name = os.path.split(path)
+        targets.setdefault(directory, set()).add(name)
+
+    removed = set()
+    for directory, names in targets.items():
+        try:
+            entries = os.scandir(directory or os.curdir)
+        except OSError as e:
+            if e.errno not in (errno.ENOENT, errno.ENOTDIR):
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name in names and not entry.is_dir(follow_symlinks=False):
+                    os.unlink(entry.path)
+                    removed.add((directory, entry.name))
+
+    return [path for path in paths if os.path.split(path) not in removed]
+
 
 class Setup(object):
     """Class that parses and processes the NPB XML configuration file.
@@ -32,14 +239,50 @@ class Setup(object):
 
     def __init__(self, args: Object, version: str) -> object:
         """Constructor."""
+        #
+        # Declare upfront the optional configuration parameters and the
+        # attributes set by the Setup methods, so that the attributes of the
+        # object do not change after initialization. The defaults of the
+        # optional parameters are overwritten by the configuration file.
+        #
+        self.secondary_observers = ()
+        self.secondary_targets = ()
+        self.orbnum_directory = ""
+        self.templates_directory = ""
+        self.information_model = None
+        self.xml_model = None
+        self.schema_location = None
+        self.context_products = None
+        self.readme = None
+        self.release_date = None
+        self.creation_date_time = None
+        self.increment_start = None
+        self.increment_finish = None
+        self.date_format = "maklabel"
+        self.end_of_line = "CRLF"
+        self.binary_endianness = None
+        self.mk = None
+        self.mk_inputs = None
+        self.orbnum = None
+        self.information_model_float = None
+        self.template_files = []
+        self.xml_tab = 0
+        self.release = None
+        self.current_release = None
+        self._release_tag = None
+        self.increment = False
+        self.fks = []
+        self.sclks = []
+        self.lsk = None
+
         try:
             #
-            # Check that the configuration file validates with its schema
+            # Check that the configuration file validates with its schema.
+            # The file is parsed only once, the resulting tree is used for
+            # both the validation and the configuration loading.
             #
-            schema = xmlschema.XMLSchema11(
-                dirname(__file__) + "/../data/configuration.xsd"
-            )
-            schema.validate(args.config)
+            tree = ET.parse(args.config)
+            _configuration_schema().validate(tree)
 
         except Exception as inst:
             if not args.debug:
@@ -50,8 +293,7 @@ class Setup(object):
         # Converting XML setup file into a dictionary and then into
         # attributes for the object.
         #
-        config = Path(args.config).read_text()
-        entries = etree_to_dict(ET.XML(config))
+        entries = etree_to_dict(tree.getroot(), force_list=_CONFIG_LISTS)
 
         #
         # Re-arrange the resulting dictionary into one-level attributes
@@ -59,90 +301,49 @@ class Setup(object):
         #
         config = entries["naif-pds4-bundler_configuration"]
 
-        self.__dict__.update(config["pds_parameters"])
-        self.__dict__.update(config["bundle_parameters"])
-        self.__dict__.update(config["mission_parameters"])
-        self.__dict__.update(config["directories"])
-
-        #
-        # Re-arrange secondary spacecrafts and secondary targets parameters.
-        #
-        if hasattr(self, "secondary_observers"):
-            if not isinstance(self.secondary_observers["observer"], list):
-                self.secondary_observers = [self.secondary_observers["observer"]]
-            else:
-                self.secondary_observers = self.secondary_observers["observer"]
-
-        if hasattr(self, "secondary_targets"):
-            if not isinstance(self.secondary_targets["target"], list):
-                self.secondary_targets = [self.secondary_targets["target"]]
-            else:
-                self.secondary_targets = self.secondary_targets["target"]
-
         #
-        # Kernel directory needs to be turned into a list.
+        # Merge all the configuration sections first and load them as
+        # attributes with a single update of the object dictionary.
         #
-        if not isinstance(self.kernels_directory, list):
-            self.kernels_directory = [self.kernels_directory]
-
-        #
-        # Generate empty orbnum directory if not present.
-        #
-        if not hasattr(self, "orbnum_directory"):
-            self.orbnum_directory = ''
+        sections = {
+            **config["pds_parameters"],
+            **config["bundle_parameters"],
+            **config["mission_parameters"],
+            **config["directories"],
+            **config["kernel_list"],
+            **config["meta-kernel"],
+        }
+        if "orbit_number_file" in config:
+            sections.update(config["orbit_number_file"])
 
         #
         # Kernel list configuration needs refactoring.
         #
-        self.__dict__.update(config["kernel_list"])
-
-        kernel_list_config = {}
-        for ker in self.kernel:
-            kernel_list_config[ker["@pattern"]] = ker
-
-        self.kernel_list_config = kernel_list_config
-        del self.kernel
+        sections["kernel_list_config"] = {
+            ker["@pattern"]: ker for ker in sections.pop("kernel")
+        }
 
         #
-        # Meta-kernel configuration; if there is one meta-kernel
-        # mk is a dictionary, otherwise it is a list of dictionaries.
-        # It is processed in such a way that it is always a list of
-        # dictionaries. Same applies to meta-kernels from configuration
-        # as user input.
+        # An empty increment time element is schema-valid but loaded as None,
+        # as if it was not provided. Keep it as an empty string so that the
+        # configuration check can tell both cases apart.
         #
-        self.__dict__.update(config["meta-kernel"])
+        for name in ("increment_start", "increment_finish"):
+            if name in sections and sections[name] is None:
+                sections[name] = ""
 
-        if hasattr(self, "mk"):
-            if isinstance(self.mk, dict):
-                self.mk = [self.mk]
+        self.__dict__.update(sections)
 
         #
-        # Meta-kernel configuration; if there is one pattern for
-        # the meta-kernel name, convert it into a list of
-        # dictionaries.
+        # Re-arrange secondary spacecrafts and secondary targets parameters.
+        # Note that these, the kernel directories, the meta-kernels and their
+        # names, and the ORBNUM files are always loaded as lists.
         #
-        if hasattr(self, "mk"):
-            for i in range(len(self.mk)):
-                if isinstance(self.mk[i]["name"], dict):
-                    self.mk[i]["name"] = [self.mk[i]["name"]]
+        if self.secondary_observers:
+            self.secondary_observers = self.secondary_observers["observer"]
 
-        #
-        # Meta-kernel configuration; if there is one coverage kernel, convert
-        # it into a list of coverage kernels.
-        #
-        if hasattr(self, "coverage_kernels"):
-            if isinstance(self.coverage_kernels, dict):
-                self.coverage_kernels = [self.coverage_kernels]
-
-        #
-        # ORBNUM configuration: if there is one orbnum file orbnum is a
-        # dictionary, otherwise it is a list of dictionaries. It is
-        # processed in such a way that it is always a list of dictionaries
-        #
-        if "orbit_number_file" in config:
-            self.__dict__.update(config["orbit_number_file"])
-            if isinstance(self.orbnum, dict):
-                self.orbnum = [self.orbnum]
+        if self.secondary_targets:
+            self.secondary_targets = self.secondary_targets["target"]
 
         #
         # Set run type for the NPB by-products file name. So far this only
@@ -168,28 +369,20 @@ class Setup(object):
         self.diff = args.diff.lower()
         self.today = datetime.date.today().strftime("%Y%m%d")
         self.file_list = []
-        self.checksum_registry = []
+        self.checksum_registry = io.BytesIO()
 
         #
         # If a release date is not specified it is set to today.
         #
-        if not hasattr(self, "release_date"):
+        if self.release_date is None:
             self.release_date = datetime.date.today().strftime("%Y-%m-%d")
         else:
-            pattern = re.compile("[0-9]{4}-[0-9]{2}-[0-9]{2}")
-            if not pattern.match(self.release_date):
+            if not _RELEASE_DATE_RE.match(self.release_date):
                 error_message(
                     "release_date parameter does not match "
                     "the required format: YYYY-MM-DD."
                 )
 
-        #
-        # Check date format, if is not provided it is set to the format
-        # proposed for the PDS4 Information Model 2.0.
-        #
-        if not hasattr(self, "date_format"):
-            self.date_format = "maklabel"
-
         #
         # Check text End of Line format and set EoL length.
         #
@@ -200,8 +393,6 @@ class Setup(object):
         # If the parameter is not provided via configuration is set by default
         # to CRLF.
         #
-        if not hasattr(self, "end_of_line"):
-            self.end_of_line = "CRLF"
         if self.end_of_line == "CRLF":
             self.eol = "\r\n"
             self.eol_len = 2
@@ -221,7 +412,7 @@ class Setup(object):
         #
         # Check and determine endianness.
         #
-        if not hasattr(self, "binary_endianness"):
+        if self.binary_endianness is None:
             if self.pds_version == '4':
                 self.kernel_endianness = "little"
             else:
@@ -279,9 +470,7 @@ class Setup(object):
             #
             # Set the time format for the Date format selected.
             #
-            pattern = re.compile(
-                "[0-9]{4}-[0-9]{2}-[0-9]{2}T" "[0-9]{2}:[0-9]{2}:[0-9]{2}.[0-9]{3}Z"
-            )
+            pattern = _INFOMOD2_RE
             format = "YYYY-MM-DDThh:mm:ss.sssZ"
         elif self.date_format == "maklabel":
 
@@ -300,9 +489,7 @@ class Setup(object):
             #
             # Set the time format for the Date format selected.
             #
-            pattern = re.compile(
-                "[0-9]{4}-[0-9]{2}-[0-9]{2}T" "[0-9]{2}:[0-9]{2}:[0-9]{2}Z"
-            )
+            pattern = _MAKLABEL_RE
             format = "YYYY-MM-DDThh:mm:ssZ"
 
         #
@@ -338,37 +525,36 @@ class Setup(object):
         # Check Bundle increment start and finish times. For the two accepted
         # formats.
         #
-        if hasattr(self, "mission_start") and self.mission_start:
-            if not pattern.match(self.mission_start):
-                error_message(
-                    f"mission_start parameter does not match the "
-                    f"required format: {format}."
-                )
-        if hasattr(self, "mission_finish") and self.mission_finish:
-            if not pattern.match(self.mission_finish):
-                error_message(
-                    f"mission_finish does not match the required format: {format}."
-                )
-        if hasattr(self, "increment_start") and self.increment_start:
-            if not pattern.match(self.increment_start):
+        for name in (
+            "mission_start",
+            "mission_finish",
+            "increment_start",
+            "increment_finish",
+        ):
+            value = getattr(self, name, None)
+            if value and not pattern.match(value):
                 error_message(
-                    f"increment_start parameter does not match the "
+                    f"{name} parameter does not match the "
                     f"required format: {format}."
                 )
-        if hasattr(self, "increment_finish") and self.increment_finish:
-            if not pattern.match(self.increment_finish):
-                error_message(
-                    f"increment_finish does not match the required " f"format: {format}."
-                )
-        if hasattr(self, "increment_start") and hasattr(self, "increment_finish"):
-            if ((not self.increment_start) and (self.increment_finish)) or (
-                (self.increment_start) and (not self.increment_finish)
-            ):
-                error_message(
-                    "If provided via configuration, increment_start and "
-                    "increment_finish parameters need to be provided "
-                    "together."
-                )
+        if (
+            self.increment_start is not None
+            and self.increment_finish is not None
+            and bool(self.increment_start) != bool(self.increment_finish)
+        ):
+            error_message(
+                "If provided via configuration, increment_start and "
+                "increment_finish parameters need to be provided "
+                "together."
+            )
+
+        #
+        # From here on an empty increment time is not provided.
+        #
+        if not self.increment_start:
+            self.increment_start = None
+        if not self.increment_finish:
+            self.increment_finish = None
 
         #
         # Check that directories are not the same.
@@ -388,8 +574,6 @@ class Setup(object):
         #
         cwd = os.getcwd()
 
-        os.chdir("/")
-
         #
         # Set the staging directory WRT PDS3 or PDS4
         #
@@ -398,14 +582,13 @@ class Setup(object):
         else:
             mission_dir = f"{self.volume_id.lower()}"
 
-        if os.path.isdir(cwd + os.sep + self.working_directory):
-            self.working_directory = cwd + os.sep + self.working_directory
-        if not os.path.isdir(self.working_directory):
+        working_directory = os.path.join(cwd, self.working_directory)
+        if not _is_dir(working_directory):
             error_message(f"Directory does not exist: {self.working_directory}.")
+        self.working_directory = working_directory
 
-        if os.path.isdir(cwd + os.sep + self.staging_directory):
-            self.staging_directory = (cwd + os.sep + self.staging_directory + f"/{mission_dir}")
-        elif not os.path.isdir(self.staging_directory):
+        staging_directory = os.path.join(cwd, self.staging_directory)
+        if not _is_dir(staging_directory):
             logging.warning(
                 f"-- Creating staging directory: {self.staging_directory}/{mission_dir}."
             )
@@ -414,68 +597,55 @@ class Setup(object):
             # fine. Otherwise the non-existence must trigger an error.
             #
             try:
-                os.mkdir(cwd + os.sep + self.staging_directory)
+                os.mkdir(staging_directory)
             except BaseException:
                 if self.faucet in ["plan", "list", "checks"]:
                     logging.warning(f"-- Staging directory cannot be created but is not used with {self.faucet} faucet.")
                 else:
                     error_message(f"Staging directory cannot be created: {self.staging_directory}.")
 
+        elif not os.path.isabs(self.staging_directory):
+            self.staging_directory = staging_directory + f"/{mission_dir}"
         elif f"/{mission_dir}" not in self.staging_directory:
             self.staging_directory += f"/{mission_dir}"
 
-        if os.path.isdir(cwd + os.sep + self.bundle_directory):
-            self.bundle_directory = cwd + os.sep + self.bundle_directory
-
         #
         # If the faucet is set to plan, kerlist, or checks, this is just
         # fine. Otherwise the non-existence must trigger an error.
         #
-        if not os.path.isdir(self.bundle_directory):
-            if self.faucet in ["plan", "list", "checks"]:
-                logging.warning(f"-- Bundle directory does not exist but is not used with {self.faucet} faucet.")
-            else:
-                error_message(f"Bundle directory does not exist: {self.bundle_directory}.")
+        bundle_directory = os.path.join(cwd, self.bundle_directory)
+        if _is_dir(bundle_directory):
+            self.bundle_directory = bundle_directory
+        elif self.faucet in ["plan", "list", "checks"]:
+            logging.warning(f"-- Bundle directory does not exist but is not used with {self.faucet} faucet.")
+        else:
+            error_message(f"Bundle directory does not exist: {self.bundle_directory}.")
 
         #
         # There might be more than one kernel directory
         #
-        for i in range(len(self.kernels_directory)):
-            if os.path.isdir(cwd + os.sep + self.kernels_directory[i]):
-                self.kernels_directory[i] = cwd + os.sep + self.kernels_directory[i]
-            if not os.path.isdir(self.kernels_directory[i]):
-                error_message(f"Directory does not exist: {self.kernels_directory[i]}.")
-
-        os.chdir(cwd)
+        for i, directory in enumerate(self.kernels_directory):
+            kernels_directory = os.path.join(cwd, directory)
+            if not _is_dir(kernels_directory):
+                error_message(f"Directory does not exist: {directory}.")
+            self.kernels_directory[i] = kernels_directory
 
         #
         # Check IM, XML model, and Schema Location coherence (given that is not
         # checked by the PDS Validate tool.
         #
-        if hasattr(self, "information_model"):
-            if re.match(r"[0-9]+[.][0-9]+[.][0-9]+[.][0-9]+", self.information_model):
+        im_version = None
+        if self.information_model is not None:
+            if _IM_RE.match(self.information_model):
 
-                major = int(self.information_model.split(".")[0])
-                minor = int(self.information_model.split(".")[1])
-                maint = int(self.information_model.split(".")[2])
-                build = int(self.information_model.split(".")[3])
-
-                if major >= 10:
-                    major = chr(major + 55)
-                if minor >= 10:
-                    minor = chr(minor + 55)
-                if maint >= 10:
-                    maint = chr(maint + 55)
-                if build >= 10:
-                    build = chr(build + 55)
-
-                short_version = f"{major}{minor}{maint}{build}"
+                im_version = _parse_im(self.information_model)
+                short_version = "".join(_IM_ALPHABET[x] for x in im_version)
 
                 #
                 # Check if xml_model is provided via configuration, if so check
                 # its validity and if not generate it.
                 #
-                if hasattr(self, "xml_model"):
+                if self.xml_model is not None:
                     xml_model_version = self.xml_model.split("PDS4_PDS_")[-1]
                     xml_model_version = xml_model_version.split(".sch")[0]
 
@@ -495,7 +665,7 @@ class Setup(object):
                 # Check if schema_location is provided via configuration, if so check
                 # its validity and if not generate it.
                 #
-                if hasattr(self, "schema_location"):
+                if self.schema_location is not None:
                     schema_loc_version = self.schema_location.split("/PDS4_PDS_")[-1]
                     schema_loc_version = schema_loc_version.split(".xsd")[0]
 
@@ -524,55 +694,25 @@ class Setup(object):
         #
         if self.pds_version == "4":
 
-            config_schema = self.information_model.split(".")
-            config_schema = float(
-                f"{int(config_schema[0]):03d}"
-                f"{int(config_schema[1]):03d}"
-                f"{int(config_schema[2]):03d}"
-                f"{int(config_schema[3]):03d}"
-            )
+            config_schema = _schema_value(im_version)
 
             #
             # Store the float value of the schema to evaluate element values
             # that depend on the IM.
             #
-            self.information_model_float = config_schema
+            self.information_model_float = _schema_float(im_version)
 
-            schemas = [
-                os.path.basename(x[:-1])
-                for x in glob.glob(f"{self.root_dir}templates/*/")
-            ]
-            schemas.remove('pds3')
-
-            schemas_eval = []
-            for schema in schemas:
-                schema = schema.split(".")
-                schema = float(
-                    f"{int(schema[0]):03d}"
-                    f"{int(schema[1]):03d}"
-                    f"{int(schema[2]):03d}"
-                    f"{int(schema[3]):03d}"
-                )
-                schemas_eval.append(schema)
+            #
+            # The schema list is ordered according to their value.
+            #
+            schemas, schemas_eval = _list_template_schemas(self.root_dir)
 
             #
-            # Reorder the schema list according to their value.
+            # Use the templates of the latest IM that is not newer than the
+            # one from the configuration, or the oldest IM otherwise.
             #
-            schemas_index = sorted(range(len(schemas_eval)),key=schemas_eval.__getitem__,reverse=True)
-            schemas_eval.sort(reverse=True)
-            schemas = [schemas[i] for i in schemas_index]
-
-            i = 0
-            while i < len(schemas_eval):
-                if config_schema < schemas_eval[i]:
-                    try:
-                        schema = schemas[i - 1]
-                    except:
-                        schema = schemas[0]
-                if config_schema >= schemas_eval[i]:
-                    schema = schemas[i]
-                    break
-                i += 1
+            i = bisect.bisect_right(schemas_eval, config_schema) - 1
+            schema = schemas[max(i, 0)]
 
             templates_directory = f"{self.root_dir}templates/{schema}/"
         #
@@ -584,14 +724,14 @@ class Setup(object):
 
 
         template_files = []
-        if not hasattr(self, "templates_directory") and self.pds_version == "4":
+        if not self.templates_directory and self.pds_version == "4":
 
             self.templates_directory = self.working_directory
 
-            templates = os.listdir(templates_directory)
+            templates = _list_template_files(templates_directory)
             for template in templates:
-                shutil.copy2(os.path.join(templates_directory,template), self.templates_directory)
-                template_files.append(self.working_directory + os.sep + template)
+                shutil.copy2(os.path.join(templates_directory, template), self.templates_directory)
+                template_files.append(os.path.join(self.working_directory, template))
 
             if config_schema in schemas_eval:
                 logging.info(
@@ -606,10 +746,7 @@ class Setup(object):
         elif self.pds_version == "4":
             if not os.path.isdir(self.templates_directory):
                 error_message("Path provided/derived for templates is not available.")
-            labels_check = [
-                os.path.basename(x)
-                for x in glob.glob(f"{self.root_dir}templates/1.5.0.0/*")
-            ]
+            labels_check = _list_template_files(f"{self.root_dir}templates/1.5.0.0/")
 
             labels = [
                 os.path.basename(x)
@@ -624,20 +761,20 @@ class Setup(object):
                     logging.warning(f"-- Template {label} has not been provided. "
                                     f"Using label from: ")
                     logging.warning(f"   {templates_directory}")
-                    shutil.copy(templates_directory + os.sep + label, self.working_directory)
-                    template_files.append(self.working_directory + os.sep + label)
+                    shutil.copy(os.path.join(templates_directory, label), self.working_directory)
+                    template_files.append(os.path.join(self.working_directory, label))
                 else:
-                    shutil.copy(self.templates_directory + os.sep + label, self.working_directory)
-                    template_files.append(self.working_directory + os.sep + label)
+                    shutil.copy(os.path.join(self.templates_directory, label), self.working_directory)
+                    template_files.append(os.path.join(self.working_directory, label))
         else:
             #
             # PDS3 templates
             #
             self.templates_directory = f"{self.root_dir}templates/pds3"
-            templates = os.listdir(self.templates_directory)
+            templates = _list_template_files(self.templates_directory)
             for template in templates:
                 shutil.copy2(os.path.join(self.templates_directory, template), self.working_directory)
-                template_files.append(self.working_directory + os.sep + template)
+                template_files.append(os.path.join(self.working_directory, template))
 
         logging.info(f"-- Label templates directory: {self.templates_directory}")
 
@@ -652,7 +789,7 @@ class Setup(object):
         if self.pds_version == '4':
             try:
                 xml_tag = '<Identification_Area>'
-                with open(self.templates_directory + os.sep + 'template_bundle.xml', 'r') as t:
+                with open(os.path.join(self.templates_directory, 'template_bundle.xml'), 'r') as t:
                     for line in t:
                         if xml_tag in line:
                             line = line.rstrip()
@@ -670,7 +807,7 @@ class Setup(object):
         #
         # Check meta-kernel configuration
         #
-        if hasattr(self, "mk"):
+        if self.mk is not None:
             for metak in self.mk:
 
                 metak_name_check = metak["@name"]
@@ -710,14 +847,6 @@ class Setup(object):
         else:
             logging.warning("-- There is no meta-kernel configuration to check.")
 
-        #
-        # Check coverage kernels configuration (needed if there is only one
-        # entry).
-        #
-        if hasattr(self, "coverage_kernels"):
-            if not isinstance(self.coverage_kernels, list):
-                self.coverage_kernels = [self.coverage_kernels]
-
         #
         # If a readme file is present the readme section of the configuration
         # is irrelevant.
@@ -727,7 +856,7 @@ class Setup(object):
             # Check readme file inputs in configuration. Raise an error immediately
             # if things do not look good.
             #
-            if hasattr(self, "readme"):
+            if self.readme is not None:
                 if "input" in self.readme and not os.path.exists(self.readme["input"]):
                     if ("cognisant_authority" in self.readme) and (
                         "overview" in self.readme
@@ -792,71 +921,69 @@ class Setup(object):
             increment = True
 
         else:
-            try:
-                releases = glob.glob(
-                    self.bundle_directory
-                    + os.sep
-                    + self.mission_acronym
-                    + "_spice"
-                    + os.sep
-                    + f"bundle_{self.mission_acronym}_spice_v*"
-                )
-                releases.sort()
-                current_release = int(releases[-1].split("_spice_v")[-1].split(".")[0])
-                current_release = f"{current_release:03}"
-                release = int(current_release) + 1
-                release = f"{release:03}"
-
-                logging.info(f"-- Generating release {release}.")
-
-                increment = True
+            current_release = max(
+                (
+                    _release_number(label, "_spice_v")
+                    for label in glob.iglob(
+                        os.path.join(
+                            self.bundle_directory,
+                            f"{self.mission_acronym}_spice",
+                            f"bundle_{self.mission_acronym}_spice_v*",
+                        )
+                    )
+                ),
+                default=-1,
+            )
 
-            except:
+            if current_release < 0:
                 if self.pds_version == '4':
                     logging.warning(
                         "-- Bundle label not found. Checking previous kernel list."
                     )
 
-                try:
-
-                    #
-                    # If the kernel list is provided as an argument, we
-                    # cannot deduce the release version from it.
-                    #
-                    if self.args.kerlist:
-                        logging.warning(
-                            "-- Kernel list provided as input. "
-                            "Release number cannot be obtained."
-                        )
-                        raise
-
-                    releases = glob.glob(
-                        self.working_directory + f"/{self.mission_acronym}"
-                        f"_{self.run_type}_*.kernel_list"
+                #
+                # If the kernel list is provided as an argument, we
+                # cannot deduce the release version from it.
+                #
+                if self.args.kerlist:
+                    logging.warning(
+                        "-- Kernel list provided as input. "
+                        "Release number cannot be obtained."
                     )
-
-                    releases.sort()
-                    current_release = int(
-                        releases[-1].split(f"_{self.run_type}_")[-1].split(".")[0]
+                else:
+                    current_release = max(
+                        (
+                            _release_number(kernel_list, f"_{self.run_type}_")
+                            for kernel_list in glob.iglob(
+                                os.path.join(
+                                    self.working_directory,
+                                    f"{self.mission_acronym}_{self.run_type}_*.kernel_list",
+                                )
+                            )
+                        ),
+                        default=-1,
                     )
-                    current_release = f"{current_release:03}"
-                    release = int(current_release) + 1
-                    release = f"{release:03}"
 
-                    logging.info(f"-- Generating release {release}")
+            if current_release >= 0:
+                release = f"{current_release + 1:03}"
+                current_release = f"{current_release:03}"
 
-                    increment = True
-                except:
+                logging.info(f"-- Generating release {release}.")
 
-                    logging.warning("-- This is the first release.")
+                increment = True
+            else:
+                logging.warning("-- This is the first release.")
 
-                    release = "001"
-                    current_release = ""
+                release = "001"
+                current_release = ""
 
-                    increment = False
+                increment = False
 
         self.release = release
         self.current_release = current_release
+        self._release_tag = (
+            f"{self.mission_acronym}_{self.run_type}_{int(release):02d}"
+        )
 
         logging.info("")
 
@@ -882,12 +1009,10 @@ class Setup(object):
 
         #
         # To get the appropriate kernels, use the kernel list config.
-        # First extract the patterns for each kernel type of interest.
+        # First extract the patterns for each kernel type of interest. The
+        # kernel types are loaded in this order.
         #
-        fk_patterns = []
-        sclk_patterns = []
-        pck_patterns = []
-        lsk_patterns = []
+        patterns_by_kind = {"lsk": [], "pck": [], "fk": [], "sclk": []}
 
         #
         # We inspect the kernels directory and the bundle directory.
@@ -898,53 +1023,21 @@ class Setup(object):
         else:
             directories.append(self.bundle_directory + f"{self.volume_id}/data")
 
-        for type in self.kernels_to_load:
-            if "fk" in type:
-                fks = self.kernels_to_load[type]
-                if not isinstance(fks, list):
-                    fks = [fks]
-                for fk in fks:
-                    fk_patterns.append(fk)
-            elif "sclk" in type:
-                sclks = self.kernels_to_load[type]
-                if not isinstance(sclks, list):
-                    sclks = [sclks]
-                for sclk in sclks:
-                    sclk_patterns.append(sclk)
-            elif "pck" in type:
-                pcks = self.kernels_to_load[type]
-                if not isinstance(pcks, list):
-                    pcks = [pcks]
-                for pck in pcks:
-                    pck_patterns.append(pck)
-            elif "lsk" in type:
-                lsks = self.kernels_to_load[type]
-                if not isinstance(lsks, list):
-                    lsks = [lsks]
-                for lsk in lsks:
-                    lsk_patterns.append(lsk)
+        for kind, patterns in self.kernels_to_load.items():
+            if kind in patterns_by_kind:
+                if not isinstance(patterns, list):
+                    patterns = [patterns]
+                patterns_by_kind[kind].extend(patterns)
 
         #
         # Search the latest version for each pattern of each kernel type.
         #
-        lsks = []
-        for pattern in lsk_patterns:
-            if os.path.exists(pattern):
-                lsks.append(pattern)
-                spiceypy.furnsh(pattern)
-            else:
-                for dir in directories:
-                    lsk_pattern = [
-                        os.path.join(root, name)
-                        for root, dirs, files in os.walk(dir)
-                        for name in files
-                        if re.fullmatch(pattern, name)
-                    ]
-                    if lsk_pattern:
-                        lsk_pattern.sort(key=kernel_name)
-                        spiceypy.furnsh(lsk_pattern[-1])
-                        lsks.append(lsk_pattern[-1])
-                        break
+        kernels = self._scan_kernels(patterns_by_kind, directories)
+        lsks = kernels["lsk"]
+        pcks = kernels["pck"]
+        fks = kernels["fk"]
+        sclks = kernels["sclk"]
+
         if not lsks:
             logging.error(f"-- LSK not found.")
         else:
@@ -952,71 +1045,16 @@ class Setup(object):
         if len(lsks) > 1:
             error_message("Only one LSK should be obtained.")
 
-        pcks = []
-        for pattern in pck_patterns:
-            if os.path.exists(pattern):
-                pcks.append(pattern)
-                spiceypy.furnsh(pattern)
-            else:
-                for dir in directories:
-                    pcks_pattern = [
-                        os.path.join(root, name)
-                        for root, dirs, files in os.walk(dir)
-                        for name in files
-                        if re.fullmatch(pattern, name)
-                    ]
-                    if pcks_pattern:
-                        pcks_pattern.sort(key=kernel_name)
-                        spiceypy.furnsh(pcks_pattern[-1])
-                        pcks.append(pcks_pattern[-1])
-                        break
         if not pcks:
             logging.info(f"-- PCK not found.")
         else:
             logging.info(f"-- PCK(s)   loaded: {pcks}")
 
-        fks = []
-        for pattern in fk_patterns:
-            if os.path.exists(pattern):
-                fks.append(pattern)
-                spiceypy.furnsh(pattern)
-            else:
-                for dir in directories:
-                    fks_pattern = [
-                        os.path.join(root, name)
-                        for root, dirs, files in os.walk(dir)
-                        for name in files
-                        if re.fullmatch(pattern, name)
-                    ]
-
-                    if fks_pattern:
-                        fks_pattern.sort(key=kernel_name)
-                        spiceypy.furnsh(fks_pattern[-1])
-                        fks.append(fks_pattern[-1])
-                        break
         if not fks:
             logging.warning(f"-- FK not found.")
         else:
             logging.info(f"-- FK(s)   loaded: {fks}")
 
-        sclks = []
-        for pattern in sclk_patterns:
-            if os.path.exists(pattern):
-                sclks.append(pattern)
-                spiceypy.furnsh(pattern)
-            else:
-                for dir in directories:
-                    sclks_pattern = [
-                        os.path.join(root, name)
-                        for root, dirs, files in os.walk(dir)
-                        for name in files
-                        if re.fullmatch(pattern, name)
-                    ]
-                    if sclks_pattern:
-                        sclks_pattern.sort(key=kernel_name)
-                        spiceypy.furnsh(sclks_pattern[-1])
-                        sclks.append(sclks_pattern[-1])
-                        break
         if not sclks:
             logging.error(f"-- SCLK not found.")
         else:
@@ -1026,7 +1064,61 @@ class Setup(object):
 
         self.fks = fks
         self.sclks = sclks
-        self.lsk = lsk
+        self.lsk = lsks[-1] if lsks else None
+
+    def _scan_kernels(self, patterns_by_kind, directories):
+        """Search and load the latest kernel for each kernel pattern.
+
+        The directories are walked only once for all the patterns. If a
+        pattern corresponds to an existing file, the file is loaded as is.
+        Otherwise the latest kernel that matches the pattern in the first
+        directory with matches is loaded. Kernels are loaded following the
+        order of the kernel types and patterns.
+
+        :param patterns_by_kind: Kernel name patterns for each kernel type
+        :type patterns_by_kind: dict
+        :param directories: Directories where the kernels are searched
+        :type directories: list
+        :return: Loaded kernels for each kernel type
+        :rtype: dict
+        """
+        searches = [
+            (kind, pattern, None if os.path.exists(pattern) else re.compile(pattern))
+            for kind, patterns in patterns_by_kind.items()
+            for pattern in patterns
+        ]
+        regexes = [
+            (j, regex) for j, (_, _, regex) in enumerate(searches) if regex
+        ]
+
+        #
+        # Matches are indexed by search and directory.
+        #
+        matches = {}
+        if regexes:
+            for i, dir in enumerate(directories):
+                for entry in scan_files(dir):
+                    for j, regex in regexes:
+                        if regex.fullmatch(entry.name):
+                            matches.setdefault((j, i), []).append(entry.path)
+
+        kernels = {kind: [] for kind in patterns_by_kind}
+        for j, (kind, pattern, regex) in enumerate(searches):
+            if not regex:
+                kernel = pattern
+            else:
+                kernel = None
+                for i in range(len(directories)):
+                    if (j, i) in matches:
+                        matches[(j, i)].sort(key=kernel_name)
+                        kernel = matches[(j, i)][-1]
+                        break
+                if not kernel:
+                    continue
+            spiceypy.furnsh(kernel)
+            kernels[kind].append(kernel)
+
+        return kernels
 
     def information_model_setup(self):
         """Setup and check PDS4 Information Model related things."""
@@ -1045,52 +1137,58 @@ class Setup(object):
         """
         if debug:
             logging.warning(
-                f"-- Running in DEBUG mode, by-product files are not cleaned up."
+                "-- Running in DEBUG mode, by-product files are not cleaned up."
             )
 
         if os.path.isfile(self.args.clear):
 
+            #
+            # Read the File List once and keep the files to be removed from
+            # the staging and final areas.
+            #
+            with open(self.args.clear, "rb") as c:
+                lines = c.read().decode("utf-8").splitlines()
+            names = [
+                name
+                for name in map(str.strip, lines)
+                if name and not any(skip in name for skip in _CLEAR_SKIP)
+            ]
+
             #
             # Remove files from the staging area.
             #
             path = self.staging_directory
-            logging.info(f"-- Removing files from staging area: {path}.")
-            with open(self.args.clear, "r") as c:
-                for line in c:
-                    if (".plan" not in line) and (".kernel_list" not in line):
-                        try:
-                            stag_file = path + os.sep + line.strip()
-                            os.remove(stag_file)
-                        except:
-                            logging.warning(f"     File {stag_file} not found.")
+            prefix = path + os.sep
+            logging.info("-- Removing files from staging area: %s.", path)
+            for stag_file in _remove_files([prefix + name for name in names]):
+                logging.warning("     File %s not found.", stag_file)
 
             #
             # Remove files from the final area.
             #
-            path = self.bundle_directory + os.sep + self.mission_acronym + "_spice/"
-
-            logging.info(f"-- Removing files from final area: {path}.")
-            with open(self.args.clear, "r") as c:
-                for line in c:
-                    if (".plan" not in line) and (".kernel_list" not in line):
-                        try:
-                            #
-                            # When NPB has been executed in label mode the final
-                            # area does not replicate the bundle directory structure
-                            # but kernels operations area.
-                            #
-                            if not os.path.exists(path):
-                                os.remove(
-                                    self.bundle_directory
-                                    + line.split("spice_kernels")[-1].strip()
-                                )
-                            #
-                            # Default case.
-                            #
-                            else:
-                                os.remove(path + line.strip())
-                        except:
-                            logging.warning(f"     File {line.strip()} not found.")
+            path = os.path.join(self.bundle_directory, f"{self.mission_acronym}_spice")
+
+            logging.info("-- Removing files from final area: %s.", path)
+
+            #
+            # When NPB has been executed in label mode the final
+            # area does not replicate the bundle directory structure
+            # but kernels operations area.
+            #
+            if not os.path.exists(path):
+                bundle_dir = self.bundle_directory
+                final_files = {
+                    bundle_dir + name.rpartition("spice_kernels")[2]: name
+                    for name in names
+                }
+            #
+            # Default case.
+            #
+            else:
+                prefix = path + os.sep
+                final_files = {prefix + name: name for name in names}
+            for final_file in _remove_files(list(final_files)):
+                logging.warning("     File %s not found.", final_files[final_file])
 
             #
             # Remove generated by-products from the working_directory.
@@ -1100,20 +1198,24 @@ class Setup(object):
                 try:
                     byproduct = self.args.clear.split('.')[0] + '.plan'
                     logging.info(
-                        f"-- Removing previous run by-product: {byproduct}."
+                        "-- Removing previous run by-product: %s.", byproduct
                     )
-                    os.remove(path + os.sep + byproduct.split(os.sep)[-1])
-                except:
-                    logging.warning(f"     File {byproduct} not found.")
+                    os.unlink(os.path.join(path, os.path.basename(byproduct)))
+                except OSError as e:
+                    if e.errno != errno.ENOENT:
+                        raise
+                    logging.warning("     File %s not found.", byproduct)
             if self.args.plan:
                 try:
                     byproduct = self.args.clear.split('.')[0] + '.kernel_list'
                     logging.info(
-                        f"-- Removing previous run by-product: {byproduct}."
+                        "-- Removing previous run by-product: %s.", byproduct
                     )
-                    os.remove(path + os.sep + byproduct.split(os.sep)[-1])
-                except:
-                    logging.warning(f"     File {byproduct} not found.")
+                    os.unlink(os.path.join(path, os.path.basename(byproduct)))
+                except OSError as e:
+                    if e.errno != errno.ENOENT:
+                        raise
+                    logging.warning("     File %s not found.", byproduct)
 
 
         else:
@@ -1146,34 +1248,28 @@ class Setup(object):
         :param checksum: Checksum value for checksum
         :type checksum: str
         """
-        self.checksum_registry.append(f"{path} {checksum}")
+        self.checksum_registry.write(f"{path} {checksum}\n".encode("utf-8"))
 
     def write_file_list(self):
         """Write the run by-product File List."""
         if self.file_list:
             with open(
-                self.working_directory
-                + os.sep
-                + f"{self.mission_acronym}_{self.run_type}_"
-                f"{int(self.release):02d}.file_list",
-                "w",
+                os.path.join(self.working_directory, self._release_tag + ".file_list"),
+                "wb",
+                buffering=_WRITE_BUFFER,
             ) as l:
-                for file in self.file_list:
-                    l.write(file + "\n")
+                l.writelines(f"{file}\n".encode("utf-8") for file in self.file_list)
             logging.info("-- Run File List file written in working area.")
 
     def write_checksum_registry(self):
         """Write the run by-product Checksum Record."""
-        if self.checksum_registry:
+        if self.checksum_registry.tell():
             with open(
-                self.working_directory
-                + os.sep
-                + f"{self.mission_acronym}_{self.run_type}_"
-                f"{int(self.release):02d}.checksum",
-                "w",
+                os.path.join(self.working_directory, self._release_tag + ".checksum"),
+                "wb",
+                buffering=_WRITE_BUFFER,
             ) as l:
-                for element in self.checksum_registry:
-                    l.write(element + "\n")
+                l.write(self.checksum_registry.getbuffer())
             logging.info("-- Run Checksum Registry file written in working area.")
 
     def write_validate_configuration(self):
@@ -1204,6 +1300,8 @@ class Setup(object):
         internet connection-- the process will silently fail but the NPB run
         will be successful.
         """
+        import requests
+
         pds_schematron_location = self.xml_model
         pds_schematron = pds_schematron_location.split('/')[-1]
         try:
@@ -29,6 +29,7 @@ from .files import mk_to_list
 from .files import product_mapping
 from .files import replace_string_in_file
 from .files import safe_make_directory
+from .files import scan_files
 from .files import string_in_file
 from .files import type_to_extension
 from .files import type_to_pds3_type
@@ -45,45 +46,46 @@ from .time import pds3_label_gen_date
 from .time import spk_coverage
 
 __all__ = [
-    add_carriage_return,
-    add_crs_to_file,
-    check_consecutive,
-    check_list_duplicates,
-    checksum_from_label,
-    checksum_from_registry,
-    compare_files,
-    copy,
-    etree_to_dict,
-    extension_to_type,
-    type_to_pds3_type,
-    extract_comment,
-    fill_template,
-    get_context_products,
-    get_latest_kernel,
-    kernel_name,
-    match_patterns,
-    md5,
-    mk_to_list,
-    safe_make_directory,
-    type_to_extension,
-    utf8len,
-    ck_coverage,
-    creation_time,
-    current_date,
-    current_time,
-    dsk_coverage,
-    get_years,
-    pck_coverage,
-    pds3_label_gen_date,
-    spk_coverage,
-    spice_exception_handler,
-    string_in_file,
-    et_to_date,
-    replace_string_in_file,
-    format_multiple_values,
-    product_mapping,
-    check_kernel_integrity,
-    check_binary_endianness,
-    check_badchar,
-    check_eol
+    "add_carriage_return",
+    "add_crs_to_file",
+    "check_consecutive",
+    "check_list_duplicates",
+    "checksum_from_label",
+    "checksum_from_registry",
+    "compare_files",
+    "copy",
+    "etree_to_dict",
+    "extension_to_type",
+    "type_to_pds3_type",
+    "extract_comment",
+    "fill_template",
+    "get_context_products",
+    "get_latest_kernel",
+    "kernel_name",
+    "match_patterns",
+    "md5",
+    "mk_to_list",
+    "safe_make_directory",
+    "scan_files",
+    "type_to_extension",
+    "utf8len",
+    "ck_coverage",
+    "creation_time",
+    "current_date",
+    "current_time",
+    "dsk_coverage",
+    "get_years",
+    "pck_coverage",
+    "pds3_label_gen_date",
+    "spk_coverage",
+    "spice_exception_handler",
+    "string_in_file",
+    "et_to_date",
+    "replace_string_in_file",
+    "format_multiple_values",
+    "product_mapping",
+    "check_kernel_integrity",
+    "check_binary_endianness",
+    "check_badchar",
+    "check_eol",
 ]
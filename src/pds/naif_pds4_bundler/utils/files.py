@@ -16,7 +16,7 @@ import spiceypy
 from ..classes.log import error_message
 
 
-def etree_to_dict(etree):
+def etree_to_dict(etree, force_list=()):
     """Convert between XML and JSON.
 
     The following XML-to-Python-dict snippet parses entities as well as
@@ -25,8 +25,15 @@ def etree_to_dict(etree):
 
     https://www.xml.com/pub/a/2006/05/31/converting-between-xml-and-json.html
 
+    Elements that can appear one or more times are converted into a list
+    only if they appear more than once, unless they are included in
+    ``force_list``, in which case they are always converted into a list.
+
     :param etree: Element Tree read from XML file
     :type etree: dict
+    :param force_list: Elements always converted into a list, provided as
+                       ``parent/child`` tag paths, e.g.: ``meta-kernel/mk``
+    :type force_list: Collection[str]
     :return: XML File converted into a JSON file
     :rtype: dict
     """
@@ -34,10 +41,15 @@ def etree_to_dict(etree):
     children = list(etree)
     if children:
         dd = defaultdict(list)
-        for dc in map(etree_to_dict, children):
-            for k, v in dc.items():
+        for child in children:
+            for k, v in etree_to_dict(child, force_list).items():
                 dd[k].append(v)
-        jtree = {etree.tag: {k: v[0] if len(v) == 1 else v for k, v in dd.items()}}
+        jtree = {
+            etree.tag: {
+                k: v[0] if len(v) == 1 and f"{etree.tag}/{k}" not in force_list else v
+                for k, v in dd.items()
+            }
+        }
     if etree.attrib:
         jtree[etree.tag].update(("@" + k, v) for k, v in etree.attrib.items())
     if etree.text:
@@ -105,6 +117,26 @@ def safe_make_directory(dir):
         pass
 
 
+#
+# SPICE kernel types indexed by the uppercase kernel extension.
+#
+_KERNEL_TYPES = {
+    "TI": "ik",
+    "TF": "fk",
+    "TM": "mk",
+    "TSC": "sclk",
+    "TLS": "lsk",
+    "TPC": "pck",
+    "BC": "ck",
+    "BSP": "spk",
+    "BPC": "pck",
+    "BES": "ek",
+    "BDS": "dsk",
+    "ORB": "orb",
+    "NRB": "orb",
+}
+
+
 def extension_to_type(kernel):
     """Given a SPICE kernel provide the SPICE kernel type.
 
@@ -113,34 +145,18 @@ def extension_to_type(kernel):
     :return: SPICE Kernel type of the input SPICE kernel name
     :rtype: str
     """
-    kernel_type_map = {
-        "TI": "IK",
-        "TF": "FK",
-        "TM": "MK",
-        "TSC": "SCLK",
-        "TLS": "LSK",
-        "TPC": "PCK",
-        "BC": "CK",
-        "BSP": "SPK",
-        "BPC": "PCK",
-        "BES": "EK",
-        "BDS": "DSK",
-        "ORB": "ORB",
-        "NRB": "ORB",
-    }
-
-    try:
+    if isinstance(kernel, str):
         #
-        # Kernel is an object
+        # Kernel is a string
         #
-        kernel_type = kernel_type_map[kernel.extension.upper()].lower()
-    except BaseException:
+        extension = kernel.rpartition(".")[2]
+    else:
         #
-        # Kernel is a string
+        # Kernel is an object
         #
-        kernel_type = kernel_type_map[kernel.split(".")[-1].upper()].lower()
+        extension = kernel.extension
 
-    return kernel_type
+    return _KERNEL_TYPES[extension.upper()]
 
 
 def type_to_pds3_type(kernel):
@@ -262,11 +278,7 @@ def check_list_duplicates(list_of_elements):
              duplicates, False otherwise
     :rtype: bool
     """
-    for elem in list_of_elements:
-        if list_of_elements.count(elem) > 1:
-            return True
-
-    return False
+    return len(set(list_of_elements)) != len(list_of_elements)
 
 
 def fill_template(object, product_file, product_dictionary):
@@ -318,7 +330,7 @@ def get_context_products(setup):
     # configuration file.
     #
     appended_products = []
-    if hasattr(setup, "context_products"):
+    if setup.context_products is not None:
         if not isinstance(setup.context_products["product"], list):
             context_products_list = [setup.context_products["product"]]
         else:
@@ -356,7 +368,7 @@ def get_context_products(setup):
     # Check the secondary s/c and if present add them to the
     # Configuration for context products.3
     #
-    if hasattr(setup, "secondary_observers"):
+    if setup.secondary_observers:
         for sc in setup.secondary_observers:
             config_context_products.append(sc)
 
@@ -364,7 +376,7 @@ def get_context_products(setup):
     # Check the secondary targets and if present add them to the
     # Configuration for context products.3
     #
-    if hasattr(setup, "secondary_targets"):
+    if setup.secondary_targets:
         for tar in setup.secondary_targets:
             config_context_products.append(tar)
 
@@ -737,7 +749,41 @@ def kernel_name(path):
     return path.split(os.sep)[-1]
 
 
-def checksum_from_registry(path, working_directory):
+def scan_files(directory):
+    """Recursively iterate over the files of a directory.
+
+    The directory tree is traversed top-down as with ``os.walk``, but using
+    ``os.scandir`` entries to avoid additional stat calls. Symbolic links to
+    directories are not followed and directories that cannot be read are
+    silently skipped.
+
+    :param directory: Directory path
+    :type directory: str
+    :return: Directory entries of the files
+    :rtype: Iterator[os.DirEntry]
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+
+    subdirectories = []
+    with entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                yield entry
+            elif not entry.is_symlink():
+                subdirectories.append(entry.path)
+
+    for subdirectory in subdirectories:
+        yield from scan_files(subdirectory)
+
+
+def checksum_from_registry(path, working_directory, checksum_registries=None):
     """Extract checksum from the checksum registry.
 
     All the checksum registries will be checked.
@@ -746,11 +792,17 @@ def checksum_from_registry(path, working_directory):
     :type path: str
     :param working_directory: checksum registry path
     :type working_directory: str
+    :param checksum_registries: Checksum registry files to check. If not
+                                provided they are listed from the working
+                                directory; callers that look up many products
+                                can list them once and pass them
+    :type checksum_registries: list
     :return: MD5 Sum for the file indicated by path
     :rtype: str
     """
     checksum = ""
-    checksum_registries = glob.glob(f"{working_directory}/*.checksum")
+    if checksum_registries is None:
+        checksum_registries = glob.glob(f"{working_directory}/*.checksum")
     checksum_found = False
 
     for checksum_registry in checksum_registries:
@@ -930,7 +982,7 @@ def product_mapping(name, setup, cleanup=True):
             if name in line:
                 get_map = True
             if get_map and "MAPPING" in line:
-                mapping = line.split("=")[-1].strip()
+                mapping = line.partition("=")[2].strip()
                 get_map = False
 
     if not cleanup:
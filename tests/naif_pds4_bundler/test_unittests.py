@@ -13,6 +13,7 @@ import unittests.test_endianness as endianness
 import unittests.test_extract_comment as extract_comment
 import unittests.test_files as files
 import unittests.test_im_format as im_format
+import unittests.test_increment as increment
 import unittests.test_kernel_integrity as kernel_integrity
 import unittests.test_kernel_list as kernel_list
 import unittests.test_match_patterns as match_patterns
@@ -149,6 +150,21 @@ class TestUnitTests(TestCase):
     def test_mk_to_list(self):
        files.test_mk_to_list(self)
 
+    def test_scan_files(self):
+       files.test_scan_files(self)
+
+    def test_check_list_duplicates(self):
+       files.test_check_list_duplicates(self)
+
+    #
+    # Increment times tests.
+    #
+    def test_increment_empty_start(self):
+        increment.test_increment_empty_start(self)
+
+    def test_increment_empty_finish(self):
+        increment.test_increment_empty_finish(self)
+
     #
     # Information Model tests.
     #
@@ -251,6 +267,21 @@ class TestUnitTests(TestCase):
     def test_xml_reader(self):
         kernel_list.test_xml_reader(self)
 
+    def test_combine_patterns(self):
+        kernel_list.test_combine_patterns(self)
+
+    def test_iter_kernels(self):
+        kernel_list.test_iter_kernels(self)
+
+    def test_file_names(self):
+        kernel_list.test_file_names(self)
+
+    def test_read_mission_template(self):
+        kernel_list.test_read_mission_template(self)
+
+    def test_check_products_unmapped(self):
+        kernel_list.test_check_products_unmapped(self)
+
     #
     # Match patterns tests.
     #
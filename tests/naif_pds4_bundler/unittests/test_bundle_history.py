@@ -9,6 +9,8 @@ def test_insight_history(self):
     test_setup.bundle_directory = "../data/insight"
     test_setup.mission_acronym = "insight"
     test_setup.xml_model = "http://pds.nasa.gov/pds4/pds/v1/test"
+    test_setup.mk = None
+    test_setup.mk_inputs = None
 
     test_bundle = Object()
     test_bundle.vid = "8.0"
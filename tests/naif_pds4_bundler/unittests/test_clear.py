@@ -21,7 +21,10 @@ def test_insight_basic(self):
     shutil.move("insight", "insight_old")
     shutil.copytree("../data/insight", "insight")
     shutil.move("kernels", "kernels_old")
-    shutil.copytree("../data/kernels", "kernels")
+    #
+    # NPB only reads the kernels; the files are linked instead of copied.
+    #
+    shutil.copytree("../data/kernels", "kernels", copy_function=os.link)
 
     with open("../data/insight.list", "r") as i:
         for line in i:
@@ -75,7 +78,10 @@ def test_insight_error(self):
     shutil.move("insight", "insight_old")
     shutil.copytree("../data/insight", "insight")
     shutil.move("kernels", "kernels_old")
-    shutil.copytree("../data/kernels", "kernels")
+    #
+    # NPB only reads the kernels; the files are linked instead of copied.
+    #
+    shutil.copytree("../data/kernels", "kernels", copy_function=os.link)
 
     #
     # Error validating the meta-kernel
@@ -1,8 +1,12 @@
 """Unit tests for the files utilities."""
+import os
+import tempfile
 import unittest
 
 import spiceypy
+from pds.naif_pds4_bundler.utils import check_list_duplicates
 from pds.naif_pds4_bundler.utils import mk_to_list
+from pds.naif_pds4_bundler.utils import scan_files
 
 
 def test_mk_to_list(self):
@@ -16,3 +20,46 @@ def test_mk_to_list(self):
 
     ker_mk_list = mk_to_list(mk, False)
     self.assertTrue(ker_mk_list)
+
+
+def test_scan_files(self):
+    """Test recursive directory scan function."""
+    directory = "../data/kernels"
+
+    walk_files = [
+        os.path.join(root, name)
+        for root, dirs, files in os.walk(directory)
+        for name in files
+    ]
+    scanned_files = [entry.path for entry in scan_files(directory)]
+    self.assertEqual(walk_files, scanned_files)
+
+    #
+    # The first match has to be the one the former os.walk based lookup
+    # returned when the same file name is present in several directories.
+    #
+    with tempfile.TemporaryDirectory() as directory:
+        for subdir in ["a", "b", os.path.join("a", "c")]:
+            os.makedirs(os.path.join(directory, subdir), exist_ok=True)
+            with open(os.path.join(directory, subdir, "kernel.bc"), "w"):
+                pass
+
+        walk_path = [
+            os.path.join(root, name)
+            for root, dirs, files in os.walk(directory)
+            for name in files
+            if name == "kernel.bc"
+        ][0]
+        scan_path = next(
+            entry.path for entry in scan_files(directory) if entry.name == "kernel.bc"
+        )
+        self.assertEqual(walk_path, scan_path)
+
+    self.assertEqual(list(scan_files("../data/not_a_directory")), [])
+
+
+def test_check_list_duplicates(self):
+    """Test the list duplicates check."""
+    self.assertFalse(check_list_duplicates([]))
+    self.assertFalse(check_list_duplicates(["a.bc", "b.bc", "c.bsp"]))
+    self.assertTrue(check_list_duplicates(["a.bc", "b.bc", "a.bc"]))
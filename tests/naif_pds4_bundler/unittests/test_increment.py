@@ -0,0 +1,52 @@
+"""Unit tests for the increment start and finish times configuration."""
+from pds.naif_pds4_bundler.__main__ import main
+
+
+def _write_config(start, finish):
+    """Write the InSight configuration with the given increment times."""
+    config = "../config/insight.xml"
+    updated_config = "working/insight.xml"
+
+    with open(config, "r") as c:
+        with open(updated_config, "w") as n:
+            for line in c:
+                if "</readme>" in line:
+                    n.write(f"</readme>\n{start}\n{finish}\n")
+                else:
+                    n.write(line)
+
+    return updated_config
+
+
+def test_increment_empty_start(self):
+    """Test an empty increment start with an increment finish.
+
+    Test is successful if the following error message is provided::
+
+        RuntimeError: If provided via configuration, increment_start and increment_finish parameters need to be provided together.
+    """
+    config = _write_config(
+        "<increment_start/>",
+        "<increment_finish>2021-04-23T20:53:00Z</increment_finish>",
+    )
+
+    with self.assertRaises(RuntimeError) as error:
+        main(config, faucet="list", silent=True)
+    self.assertIn("need to be provided together", str(error.exception))
+
+
+def test_increment_empty_finish(self):
+    """Test an increment start with an empty increment finish.
+
+    Test is successful if the following error message is provided::
+
+        RuntimeError: If provided via configuration, increment_start and increment_finish parameters need to be provided together.
+    """
+    config = _write_config(
+        "<increment_start>2021-04-03T20:53:00Z</increment_start>",
+        "<increment_finish></increment_finish>",
+    )
+
+    with self.assertRaises(RuntimeError) as error:
+        main(config, faucet="list", silent=True)
+    self.assertIn("need to be provided together", str(error.exception))
@@ -1,13 +1,23 @@
 """Unit tests for kernel list generation."""
+import glob
 import os
+import re
 import shutil
+import tempfile
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest import TestCase
+from unittest import mock
 from xml.etree import cElementTree
 
 from pds.naif_pds4_bundler.__main__ import main
 from pds.naif_pds4_bundler.classes.list import KernelList
+from pds.naif_pds4_bundler.classes.list import _combine_patterns
+from pds.naif_pds4_bundler.classes.list import _file_names
+from pds.naif_pds4_bundler.classes.list import _iter_kernels
+from pds.naif_pds4_bundler.classes.list import _read_mission_template
+from pds.naif_pds4_bundler.classes.list import scan_files
 from pds.naif_pds4_bundler.classes.object import Object
 from pds.naif_pds4_bundler.classes.setup import Setup
 from pds.naif_pds4_bundler.utils import etree_to_dict
@@ -324,6 +334,18 @@ def test_xml_reader(self):
     config = Path("../config/insight.xml").read_text()
     etree_to_dict(cElementTree.XML(config))
 
+    #
+    # Test of XML parsing forcing elements into lists.
+    #
+    entries = etree_to_dict(
+        cElementTree.XML(config),
+        force_list=("directories/kernels_directory", "meta-kernel/mk"),
+    )
+    entries = entries["naif-pds4-bundler_configuration"]
+    self.assertIsInstance(entries["directories"]["kernels_directory"], list)
+    self.assertIsInstance(entries["meta-kernel"]["mk"], list)
+    self.assertIsInstance(entries["directories"]["working_directory"], str)
+
     #
     # Dummy initialization values for Setup class
     #
@@ -347,3 +369,123 @@ def test_xml_reader(self):
     setup.release = "008"
 
     KernelList(setup)
+
+
+def test_combine_patterns(self):
+    """Test the combination of the release plan patterns.
+
+    The combined pattern must match a name if and only if any of the
+    patterns does. Patterns with groups are not combined.
+    """
+    patterns = [
+        re.compile(r"insight_ida_enc_[0-9]{6}_[0-9]{6}_v[0-9]\.bc"),
+        re.compile(r"naif[0-9]{4}\.tls"),
+    ]
+    combined = _combine_patterns(patterns)
+
+    names = [
+        "insight_ida_enc_200829_201220_v1.bc",
+        "naif0012.tls",
+        "insight_v05.tf",
+        "xnaif0012.tls",
+    ]
+    for name in names:
+        self.assertEqual(
+            bool(combined.match(name)),
+            any(pattern.match(name) for pattern in patterns),
+        )
+        self.assertEqual(
+            bool(combined.search(name)),
+            any(pattern.search(name) for pattern in patterns),
+        )
+
+    self.assertIsNone(_combine_patterns([re.compile(r"(insight)_v05\.tf")]))
+    self.assertIsNone(_combine_patterns([]))
+
+
+def test_iter_kernels(self):
+    """Test the kernels directory traversal used to write the plan.
+
+    The result must be the one of a recursive glob without meta-kernels.
+    """
+    directory = "../data/kernels"
+    globbed = sorted(
+        path
+        for path in glob.glob(f"{directory}/**/*.*", recursive=True)
+        if os.path.isfile(path) and ".tm" not in os.path.basename(path)
+    )
+
+    self.assertTrue(globbed)
+    self.assertEqual(sorted(_iter_kernels(directory)), globbed)
+    self.assertEqual(list(_iter_kernels("../data/not_a_directory")), [])
+
+
+def test_file_names(self):
+    """Test the kernels directory index used to validate the list."""
+    directory = "../data/kernels"
+    globbed = {path.name for path in Path(directory).rglob("*") if path.is_file()}
+
+    self.assertTrue(globbed)
+    self.assertEqual(_file_names(directory), globbed)
+    self.assertEqual(_file_names("../data/not_a_directory"), set())
+
+
+def test_read_mission_template(self):
+    """Test the PDS3 Mission Template cache.
+
+    A template updated in between reads must be read again.
+    """
+    template = "working/m01_mission_template.pds"
+    shutil.copy2("../data/m01_mission_template.pds", template)
+
+    mtime = os.stat(template).st_mtime_ns
+    text = _read_mission_template(template, mtime)
+    self.assertIn("--", text)
+    self.assertIs(_read_mission_template(template, mtime), text)
+
+    with open(template, "a") as t:
+        t.write("--NEW_OPTION\n")
+    os.utime(template, ns=(mtime + 1, mtime + 1))
+
+    text = _read_mission_template(template, os.stat(template).st_mtime_ns)
+    self.assertIn("--NEW_OPTION", text)
+
+
+def test_check_products_unmapped(self):
+    """Test that a product without mapping scans each directory once.
+
+    ``product_mapping`` returns False when the Kernel List provides no
+    mapping for the product; the mapped lookup must then be skipped.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        kernels_directories = []
+        for name in ["kernels_a", "kernels_b"]:
+            kernels_directory = os.path.join(directory, name)
+            os.makedirs(os.path.join(kernels_directory, "mk"))
+            Path(kernels_directory, "mk", "insight_v07.tm").touch()
+            kernels_directories.append(kernels_directory)
+
+        with open(os.path.join(directory, "insight_release_08.kernel_list"), "w") as lst:
+            lst.write("FILE             = spice_kernels/mk/insight_v08.tm\n")
+
+        setup = SimpleNamespace(
+            step=1,
+            args=SimpleNamespace(silent=True, verbose=False),
+            kernels_directory=kernels_directories,
+            working_directory=directory,
+            mission_acronym="insight",
+            run_type="release",
+            release="8",
+        )
+        kernel_list = KernelList.__new__(KernelList)
+        kernel_list.setup = setup
+        kernel_list.kernel_list = ["insight_v08.tm"]
+
+        with mock.patch(
+            "pds.naif_pds4_bundler.classes.list.scan_files", wraps=scan_files
+        ) as scan:
+            kernel_list.check_products()
+
+        self.assertEqual(
+            [call.args[0] for call in scan.call_args_list], kernels_directories
+        )